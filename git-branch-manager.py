@@ -3,9 +3,12 @@
 import subprocess
 import sys
 import os
+import shutil
 from typing import List, Optional, NamedTuple, Dict, Tuple, Any
 import curses
-from datetime import datetime, timedelta
+from datetime import datetime
+from bisect import bisect_right
+import heapq
 import time
 import json
 import webbrowser
@@ -14,7 +17,7 @@ import re
 import threading
 import argparse
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor
 from queue import Queue
 
 # Load version from VERSION file
@@ -26,9 +29,8 @@ else:
 
 # Default cache TTL values (in seconds)
 DEFAULT_CACHE_TTL = {
-    'current_branch': 5,        # 5 seconds
     'uncommitted_changes': 5,   # 5 seconds  
-    'local_branches': 30,       # 30 seconds
+    'local_branches': 5,        # 5 seconds (includes current branch)
     'branch_info': 30,          # 30 seconds (for-each-ref)
     'commit_counts': 60,        # 1 minute
     'remote_branches': 300,     # 5 minutes
@@ -124,11 +126,167 @@ class GitCache:
             'size': len(self.cache)
         }
 
+# Upper bounds (in seconds) of each relative date bucket, and the
+# (divisor, unit) used to format ages that fall into the matching bucket
+_RELATIVE_DATE_THRESHOLDS = (3600, 86400, 172800, 604800, 2592000, 31536000)
+_RELATIVE_DATE_UNITS = (
+    (60, 'minute'),
+    (3600, 'hour'),
+    (None, 'yesterday'),
+    (86400, 'day'),
+    (604800, 'week'),
+    (2592000, 'month'),
+    (31536000, 'year'),
+)
+
+# Formatted relative dates keyed by age in whole minutes. Every threshold
+# and divisor above is a multiple of 60, so the minute fully determines
+# the string; cleared once it grows past _RELATIVE_DATE_CACHE_SIZE entries
+_RELATIVE_DATE_CACHE: Dict[int, str] = {}
+_RELATIVE_DATE_CACHE_SIZE = 4096
+
+# Date color pair indexed by commit age in whole days (clamped to 0-365):
+# magenta under a week, white up to 30 days, red beyond that
+_AGE_COLOR_LUT = bytes([5] * 7 + [8] * 24 + [7] * (366 - 31))
+
+# Separator between the fields of a branch row and of the header status line
+_SEPARATOR = " • "
+
+# Confirmation dialog choices, laid out once as a single line
+_CONFIRM_OPTIONS_LINE = "   ".join(("[Y]es", "[N]o", "[C]ancel"))
+
+# Key codes the input dialog inserts as text (printable ASCII)
+_PRINTABLE_KEYS = frozenset(range(32, 127))
+
+# Main loop keys that only move the selection and leave the screen untouched
+_NAVIGATION_KEYS = frozenset((
+    curses.KEY_UP, curses.KEY_DOWN, curses.KEY_PPAGE, curses.KEY_NPAGE, curses.KEY_HOME, curses.KEY_END
+))
+
+# Help screen lines as (text, curses attribute), shared by every show_help call
+_HELP_LINES = (
+    ("Git Branch Manager - Help", curses.A_BOLD),
+    ("=" * 30, 0),
+    ("", 0),
+    ("Navigation:", curses.A_BOLD),
+    ("  ↑/↓        Navigate through branches", 0),
+    ("  PgUp/PgDn  Navigate by page", 0),
+    ("  Home/End   Jump to first/last branch", 0),
+    ("  q          Quit", 0),
+    ("  ESC        Clear filters (or quit if no filters)", 0),
+    ("  ?          Show this help", 0),
+    ("", 0),
+    ("Branch Operations:", curses.A_BOLD),
+    ("  Enter      Checkout selected branch", 0),
+    ("  D          Delete selected branch", 0),
+    ("  M          Rename/move selected branch", 0),
+    ("  N          Create new branch from current", 0),
+    ("", 0),
+    ("Stash Management:", curses.A_BOLD),
+    ("  S          Pop last stash (if available)", 0),
+    ("  Auto-detect Branch stashes detected when switching branches", 0),
+    ("", 0),
+    ("View Options:", curses.A_BOLD),
+    ("  r          Reload branch list", 0),
+    ("  t          Toggle remote branches (auto-fetches)", 0),
+    ("  f          Fetch latest from remote", 0),
+    ("  b          Open branch in browser", 0),
+    ("  B          Open branch comparison/PR in browser", 0),
+    ("", 0),
+    ("Filtering:", curses.A_BOLD),
+    ("  /          Search branches by name", 0),
+    ("  a          Toggle author filter (show only your branches)", 0),
+    ("  o          Toggle old branches filter (hide >3 months)", 0),
+    ("  m          Toggle merged filter (hide merged branches)", 0),
+    ("  p          Filter by prefix (feature/, bugfix/, etc)", 0),
+    ("  c          Clear all filters", 0),
+    ("", 0),
+    ("Status Indicators:", curses.A_BOLD),
+    ("  *          Current branch", 0),
+    ("  ↓          Remote branch", 0),
+    ("  [modified] Uncommitted changes", 0),
+    ("  [unpushed] Local branch not on remote", 0),
+    ("  [merged]   Branch merged into main/master", 0),
+    ("  [worktree] Branch checked out in worktree", 0),
+    ("  [+N]       N commits ahead of main/master", 0),
+    ("  [-N]       N commits behind main/master", 0),
+    ("  [+N/-M]    N ahead and M behind main/master", 0),
+    ("  ↻          Branch metadata still loading", 0),
+    ("", 0),
+    ("Color Coding:", curses.A_BOLD),
+    ("  Green      Current branch, [+N] ahead only", 0),
+    ("  Cyan       Branch names", 0),
+    ("  Yellow     Modified indicator, [-N] behind only", 0),
+    ("  Magenta    Recent commits (<1 week), [+N/-M] mixed", 0),
+    ("  Blue       Commit hashes", 0),
+    ("  Red        Old branches (>1 month)", 0),
+    ("", 0),
+    ("↑/↓ to scroll, any other key to return...", curses.A_BOLD),
+)
+
+# Hosted platform domains found in a lowercased remote URL, matched in one
+# search; the leftmost domain in the URL decides the platform
+_PLATFORM_RE = re.compile(r'github\.com|gitlab\.com|bitbucket\.org|dev\.azure\.com|visualstudio\.com')
+_PLATFORM_BY_DOMAIN = {
+    'github.com': 'github',
+    'gitlab.com': 'gitlab',
+    'bitbucket.org': 'bitbucket-cloud',
+    'dev.azure.com': 'azure-devops',
+    'visualstudio.com': 'azure-devops',
+}
+
+# Project key and repository in a Bitbucket Server URL path
+_BB_SERVER_RE = re.compile(r'projects/([^/]+)/repos/([^/]+)')
+
+def format_relative_age(seconds: int) -> str:
+    """Format an age in seconds as a relative time string.
+    
+    Args:
+        seconds: Seconds elapsed since the commit
+        
+    Returns:
+        Relative time string such as "3 days ago" or "yesterday"
+    """
+    minutes = seconds // 60
+    text = _RELATIVE_DATE_CACHE.get(minutes)
+    if text is not None:
+        return text
+    
+    divisor, unit = _RELATIVE_DATE_UNITS[bisect_right(_RELATIVE_DATE_THRESHOLDS, seconds)]
+    if divisor is None:
+        text = unit
+    else:
+        count = seconds // divisor
+        text = f"{count} {unit}{'s' if count != 1 else ''} ago"
+    
+    if len(_RELATIVE_DATE_CACHE) >= _RELATIVE_DATE_CACHE_SIZE:
+        _RELATIVE_DATE_CACHE.clear()
+    _RELATIVE_DATE_CACHE[minutes] = text
+    return text
+
+def age_color(seconds: int) -> int:
+    """Get the color pair for the commit date of a branch of the given age.
+    
+    Args:
+        seconds: Seconds elapsed since the commit
+        
+    Returns:
+        Color pair number: magenta within a week, red after a month
+    """
+    return _AGE_COLOR_LUT[max(0, min(seconds // 86400, 365))]
+
 class BranchInfo(NamedTuple):
+    """Immutable snapshot of one branch's display data.
+    
+    Kept as a NamedTuple: instances are plain tuples with no per-instance
+    __dict__, construction runs in C, and updates go through _replace so
+    the row cache can detect a changed branch by identity. A slotted
+    dataclass would not be smaller or faster to build, and needs Python 3.10.
+    """
     name: str
     is_current: bool
     commit_hash: str
-    commit_date: datetime
+    commit_timestamp: int  # Commit date as Unix time, for integer age arithmetic
     commit_message: str
     commit_author: str
     has_uncommitted_changes: bool
@@ -140,31 +298,17 @@ class BranchInfo(NamedTuple):
     commits_ahead: int  # Number of commits ahead of main/master
     commits_behind: int  # Number of commits behind main/master
     
-    def format_relative_date(self) -> str:
-        """Format the commit date as a relative time string."""
-        now = datetime.now()
-        diff = now - self.commit_date
-        
-        if diff.days == 0:
-            if diff.seconds < 3600:
-                minutes = diff.seconds // 60
-                return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-            else:
-                hours = diff.seconds // 3600
-                return f"{hours} hour{'s' if hours != 1 else ''} ago"
-        elif diff.days == 1:
-            return "yesterday"
-        elif diff.days < 7:
-            return f"{diff.days} day{'s' if diff.days != 1 else ''} ago"
-        elif diff.days < 30:
-            weeks = diff.days // 7
-            return f"{weeks} week{'s' if weeks != 1 else ''} ago"
-        elif diff.days < 365:
-            months = diff.days // 30
-            return f"{months} month{'s' if months != 1 else ''} ago"
-        else:
-            years = diff.days // 365
-            return f"{years} year{'s' if years != 1 else ''} ago"
+    relative_date: str = ""  # Relative commit date, formatted once when the branch is loaded
+    date_color: int = 0  # Color pair for the commit age, set alongside relative_date
+    
+    @property
+    def commit_date(self) -> datetime:
+        """Commit date as a local datetime, built only when needed."""
+        return datetime.fromtimestamp(self.commit_timestamp)
+    
+    def format_relative_date(self, now: Optional[int] = None) -> str:
+        """Format the commit date as a relative time string, given Unix time now."""
+        return format_relative_age((now or int(time.time())) - self.commit_timestamp)
 
 class GitPlatformURLBuilder:
     """Builds URLs for different Git hosting platforms.
@@ -190,6 +334,7 @@ class GitPlatformURLBuilder:
         self.remote_url = remote_url
         self.platform = self._detect_platform()
         self.repo_info = self._parse_remote_url()
+        self._url_cache: Dict[Tuple[str, str, str], Optional[str]] = {}  # Built URLs by (kind, branch, base)
     
     def _detect_platform(self) -> str:
         """Detect the Git hosting platform from the remote URL.
@@ -206,14 +351,9 @@ class GitPlatformURLBuilder:
         
         url = self.remote_url.lower()
         
-        if 'github.com' in url:
-            return 'github'
-        elif 'gitlab.com' in url:
-            return 'gitlab'
-        elif 'bitbucket.org' in url:
-            return 'bitbucket-cloud'
-        elif 'dev.azure.com' in url or 'visualstudio.com' in url:
-            return 'azure-devops'
+        match = _PLATFORM_RE.search(url)
+        if match:
+            return _PLATFORM_BY_DOMAIN[match.group()]
         elif '/projects/' in url and '/repos/' in url:
             # Bitbucket Server pattern
             return 'bitbucket-server'
@@ -259,35 +399,34 @@ class GitPlatformURLBuilder:
         # Platform-specific parsing
         if self.platform == 'github':
             # github.com/owner/repo
-            parts = path.split('/')
+            parts = path.split('/', 2)
             if len(parts) >= 2:
                 info['owner'] = parts[0]
                 info['repo'] = parts[1]
         
         elif self.platform == 'gitlab':
             # gitlab.com/owner/repo or gitlab.com/group/subgroup/repo
-            parts = path.split('/')
-            if len(parts) >= 2:
-                info['owner'] = '/'.join(parts[:-1])
-                info['repo'] = parts[-1]
+            parts = path.rsplit('/', 1)
+            if len(parts) == 2:
+                info['owner'], info['repo'] = parts
         
         elif self.platform == 'bitbucket-cloud':
             # bitbucket.org/workspace/repo
-            parts = path.split('/')
+            parts = path.split('/', 2)
             if len(parts) >= 2:
                 info['workspace'] = parts[0]
                 info['repo'] = parts[1]
         
         elif self.platform == 'bitbucket-server':
             # domain/projects/PROJECT/repos/repo
-            match = re.search(r'projects/([^/]+)/repos/([^/]+)', path)
+            match = _BB_SERVER_RE.search(path)
             if match:
                 info['project'] = match.group(1)
                 info['repo'] = match.group(2)
         
         elif self.platform == 'azure-devops':
             # dev.azure.com/org/project/_git/repo
-            parts = path.split('/')
+            parts = path.split('/', 4)
             if len(parts) >= 4 and parts[2] == '_git':
                 info['org'] = parts[0]
                 info['project'] = parts[1]
@@ -300,6 +439,8 @@ class GitPlatformURLBuilder:
         
         Generates platform-specific URLs for viewing branch content.
         Handles URL encoding for branch names with special characters.
+        Built URLs are kept per branch, so opening the same branch again
+        skips the quoting and formatting.
         
         Args:
             branch_name: Name of the branch to view
@@ -311,6 +452,13 @@ class GitPlatformURLBuilder:
         if not self.repo_info:
             return None
         
+        key = ('branch', branch_name, '')
+        if key not in self._url_cache:
+            self._url_cache[key] = self._format_branch_url(branch_name)
+        return self._url_cache[key]
+    
+    def _format_branch_url(self, branch_name: str) -> Optional[str]:
+        """Format the branch URL for build_branch_url, which caches the result."""
         if self.platform == 'github':
             return f"https://github.com/{self.repo_info['owner']}/{self.repo_info['repo']}/tree/{urllib.parse.quote(branch_name)}"
         
@@ -337,6 +485,7 @@ class GitPlatformURLBuilder:
         
         Generates platform-specific URLs for comparing branches or creating
         pull/merge requests. Uses configured default base branch if none specified.
+        Like build_branch_url, built URLs are kept per branch and base.
         
         Args:
             branch_name: Source branch to compare
@@ -352,6 +501,13 @@ class GitPlatformURLBuilder:
         if not base_branch:
             base_branch = self.config.get('default_base_branch', 'main')
         
+        key = ('compare', branch_name, base_branch)
+        if key not in self._url_cache:
+            self._url_cache[key] = self._format_compare_url(branch_name, base_branch)
+        return self._url_cache[key]
+    
+    def _format_compare_url(self, branch_name: str, base_branch: str) -> Optional[str]:
+        """Format the compare URL for build_compare_url, which caches the result."""
         if self.platform == 'github':
             return f"https://github.com/{self.repo_info['owner']}/{self.repo_info['repo']}/compare/{urllib.parse.quote(base_branch)}...{urllib.parse.quote(branch_name)}"
         
@@ -403,7 +559,14 @@ class GitBranchManager:
         self.filtered_branches: List[BranchInfo] = []  # Filtered view of branches
         self.current_branch: Optional[str] = None
         self.selected_index: int = 0
+        self._scroll_offset: int = 0  # Index of the first branch row on screen
         self.working_dir: str = os.getcwd()  # Store current working directory
+        # Read-only commands like git status skip optional locks (e.g. the index refresh write)
+        self._git_env: Dict[str, str] = dict(os.environ, GIT_OPTIONAL_LOCKS='0')
+        # Absolute executable paths, resolved once so subprocess can launch via posix_spawn
+        self._executables: Dict[str, str] = {}
+        self._cat_file: Optional[subprocess.Popen] = None  # git cat-file --batch-check helper, started on first use
+        self._cat_file_lock = threading.Lock()
         self.show_remotes: bool = False  # Toggle for showing remote branches
         
         # Filters
@@ -412,9 +575,16 @@ class GitBranchManager:
         self.age_filter: bool = False  # Hide old branches (>3 months)
         self.prefix_filter: str = ""  # Filter by prefix
         self.merged_filter: bool = False  # Hide merged branches
-        self.current_user: Optional[str] = self._get_current_user()
+        self._current_user: Optional[str] = None  # git user.email, looked up by the current_user property
+        self._current_user_loaded: bool = False
         self.last_stash_ref: Optional[str] = None  # Track last stash created
         self.protected_branches: List[str] = ["main", "master"]  # Protected branches
+        self.is_worktree: bool = self._detect_worktree()
+        self._git_dir: Optional[str] = self._find_git_dir()
+        self._git_common_dir: Optional[str] = self._find_common_dir()
+        self._ref_cache: Optional[Tuple[Tuple[bool, Tuple], Tuple[str, Dict[str, Dict], Dict[str, Dict]]]] = None  # Last for-each-ref result and its ref stamp
+        self._pygit2_failed: bool = False  # Set once pygit2 can't be imported or can't open the repo
+        self._search_names: Dict[str, str] = {}  # Branch name -> lowercased name for the search filter
         
         # Configuration
         self.config: Dict[str, Any] = self._load_config()
@@ -435,8 +605,57 @@ class GitBranchManager:
         
         # Thread pool for background operations
         self.executor = ThreadPoolExecutor(max_workers=4)
+        # The load's own jobs get single-worker pools, so they never queue behind
+        # enrichment tasks and enrichment workers can wait on the remote listing
+        self._status_executor = ThreadPoolExecutor(max_workers=1)  # Uncommitted changes check
+        self._remote_refs_executor = ThreadPoolExecutor(max_workers=1)  # Deferred remote listing
         self.enrichment_queue = Queue()
         self.enrichment_in_progress = set()  # Track branches being enriched
+        self._enrichment_results: Queue = Queue()  # Enriched branches waiting for the main loop to apply them
+        self._enrichment_lock = threading.Lock()  # Serializes shared enrichment lookups
+        self._ahead_behind_supported: bool = True  # Cleared if git lacks %(ahead-behind)
+        self._uncommitted_future: Optional[Future] = None  # Uncommitted changes check started before the first load
+        self._remote_refs_future: Optional[Future] = None  # Remote branch listing still running for the current list
+        self._fetch_future: Optional[Future] = None  # git fetch started with 'f', still running
+        # Main loop action keys (upper and lower case where both work); quit and
+        # navigation keys are handled in run() as they change the loop's own state
+        self._key_handlers: Dict[int, Any] = {
+            ord('?'): self.show_help,
+            ord('t'): self._on_toggle_remotes,
+            ord('T'): self._on_toggle_remotes,
+            ord('f'): self._on_fetch,
+            ord('F'): self._on_fetch,
+            ord('r'): self._on_reload,
+            ord('R'): self._on_reload,
+            ord('/'): self._on_search,
+            ord('a'): self._on_toggle_author_filter,
+            ord('A'): self._on_toggle_author_filter,
+            ord('o'): self._on_toggle_age_filter,
+            ord('O'): self._on_toggle_age_filter,
+            ord('m'): self._on_toggle_merged_filter,
+            ord('p'): self._on_prefix_filter,
+            ord('P'): self._on_prefix_filter,
+            ord('c'): self._on_clear_filters,
+            ord('C'): self._on_clear_filters,
+            ord('S'): self._on_pop_stash,
+            ord('N'): self._on_create_branch,
+            ord('D'): self._on_delete_branch,
+            ord('M'): self._on_rename_branch,
+            ord('B'): self._on_open_compare_in_browser,
+            ord('b'): self._on_open_branch_in_browser,
+            ord('\n'): self._on_checkout,
+            curses.KEY_ENTER: self._on_checkout,
+        }
+        # Without batched ahead/behind counts, per-branch counts are only run for rows that have been shown
+        self._counts_wanted: set = set()  # Branches whose rows have been on screen
+        self._counts_pending: set = set()  # Branches enriched without their counts
+        
+        # Formatted branch rows, rebuilt only when a branch or the width changes
+        self._row_cache: Dict[str, Tuple[BranchInfo, bool, Tuple[str, Tuple[Tuple[int, int, int], ...]]]] = {}
+        self._row_cache_width: int = 0
+        self._rule: str = ""  # Header/footer separator line for the current width
+        self._color_pairs: List[int] = []  # Attributes of color pairs 0-9, filled in once curses starts
+        self._relative_dates_minute: int = 0  # Minute (Unix time // 60) relative dates were formatted in
         
     def _get_config_path(self) -> str:
         """Get the path to the configuration file.
@@ -465,7 +684,8 @@ class GitBranchManager:
             'default_base_branch': 'main',
             'browser_command': 'open' if sys.platform == 'darwin' else 'xdg-open' if sys.platform.startswith('linux') else 'start',
             'custom_patterns': {},
-            'prevent_browser_for_merged': False  # Prevent opening browser for merged branches
+            'prevent_browser_for_merged': False,  # Prevent opening browser for merged branches
+            'use_pygit2': False  # Read branch refs in-process with pygit2 when it is installed
         }
         
         if os.path.exists(config_path):
@@ -539,6 +759,13 @@ class GitBranchManager:
             else:
                 warnings.append(f"Invalid prevent_browser_for_merged value, using False")
         
+        # Validate use_pygit2
+        if 'use_pygit2' in user_config:
+            if isinstance(user_config['use_pygit2'], bool):
+                validated['use_pygit2'] = user_config['use_pygit2']
+            else:
+                warnings.append(f"Invalid use_pygit2 value, using False")
+        
         # Print warnings if any
         if warnings:
             print("\nConfiguration warnings:")
@@ -614,7 +841,14 @@ class GitBranchManager:
         """Run a command in the current working directory.
         
         Wrapper around subprocess.run that ensures commands are executed
-        in the correct working directory.
+        in the correct working directory with GIT_OPTIONAL_LOCKS=0, so
+        background git commands don't contend with the user's own git
+        processes for locks.
+        
+        The executable is resolved to an absolute path and the call skips
+        cwd and close_fds when they are redundant, which lets CPython 3.8+
+        launch the child with posix_spawn (vfork) instead of fork + exec.
+        Every fd Python opens is non-inheritable, so nothing leaks into git.
         
         Args:
             cmd: Command and arguments as a list
@@ -623,10 +857,219 @@ class GitBranchManager:
         Returns:
             CompletedProcess instance with command results
         """
-        if 'cwd' not in kwargs:
+        return subprocess.run(self._prepare_command(cmd, kwargs), **kwargs)
+    
+    def _prepare_command(self, cmd: List[str], kwargs: Dict[str, Any]) -> List[str]:
+        """Fill in the subprocess defaults shared by _run_command and _ref_exists.
+        
+        Args:
+            cmd: Command and arguments as a list
+            kwargs: Keyword arguments for subprocess, updated in place
+            
+        Returns:
+            The command with its executable resolved to an absolute path
+        """
+        if 'cwd' not in kwargs and self.working_dir != os.getcwd():
             kwargs['cwd'] = self.working_dir
-        return subprocess.run(cmd, **kwargs)
+        if 'env' not in kwargs:
+            kwargs['env'] = self._git_env
+        kwargs.setdefault('close_fds', False)
+        executable = self._executables.get(cmd[0])
+        if executable is None:
+            executable = shutil.which(cmd[0]) or cmd[0]
+            self._executables[cmd[0]] = executable
+        return [executable] + list(cmd[1:])
+    
+    def _ref_exists(self, ref: str) -> bool:
+        """Check whether a ref exists using a long-running git cat-file process.
+        
+        The first call starts git cat-file --batch-check and later calls
+        reuse it, so lookups cost a pipe round trip instead of starting
+        git. If the helper can't be used the check falls back to
+        git rev-parse --verify.
+        
+        Args:
+            ref: Full ref name such as refs/heads/main
+            
+        Returns:
+            True if the ref resolves to an object, False otherwise
+        """
+        with self._cat_file_lock:
+            try:
+                if self._cat_file is None or self._cat_file.poll() is not None:
+                    kwargs = {'stdin': subprocess.PIPE, 'stdout': subprocess.PIPE, 'stderr': subprocess.DEVNULL}
+                    self._cat_file = subprocess.Popen(
+                        self._prepare_command(["git", "cat-file", "--batch-check=%(objectname)"], kwargs),
+                        **kwargs
+                    )
+                self._cat_file.stdin.write(ref.encode('utf-8') + b'\n')
+                self._cat_file.stdin.flush()
+                line = self._cat_file.stdout.readline()
+                if line:
+                    return not line.endswith(b' missing\n')
+            except OSError:
+                pass
+            self._cat_file = None
+        
+        result = self._run_command(
+            ["git", "rev-parse", "--verify", "--quiet", ref],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False
+        )
+        return result.returncode == 0
+        
+    def _detect_worktree(self) -> bool:
+        """Check whether the working directory is inside a linked worktree.
+        
+        Walks up from the working directory to the repository root without
+        spawning git. A linked worktree has a .git file (pointing at the main
+        repository) instead of a .git directory.
+        
+        Returns:
+            True if the repository root contains a .git file, False otherwise
+        """
+        path = os.path.abspath(self.working_dir)
+        while True:
+            git_path = os.path.join(path, '.git')
+            if os.path.exists(git_path):
+                return os.path.isfile(git_path)
+            parent = os.path.dirname(path)
+            if parent == path:
+                return False
+            path = parent
+    
+    def _find_git_dir(self) -> Optional[str]:
+        """Locate the git directory holding this checkout's HEAD and index.
+        
+        Like _detect_worktree this walks up without spawning git. For a
+        linked worktree the .git file's gitdir line points at the
+        per-worktree directory, which has its own HEAD and index.
+        
+        Returns:
+            Path to the git directory, or None if it can't be found
+        """
+        path = os.path.abspath(self.working_dir)
+        while True:
+            git_path = os.path.join(path, '.git')
+            if os.path.isdir(git_path):
+                return git_path
+            if os.path.isfile(git_path):
+                try:
+                    with open(git_path) as f:
+                        line = f.readline().strip()
+                except OSError:
+                    return None
+                if not line.startswith('gitdir:'):
+                    return None
+                return os.path.join(path, line[len('gitdir:'):].strip())
+            parent = os.path.dirname(path)
+            if parent == path:
+                return None
+            path = parent
+    
+    def _find_common_dir(self) -> Optional[str]:
+        """Locate the git directory shared by all worktrees.
+        
+        Branch refs live in the common directory; a linked worktree's own
+        git directory names it in its commondir file.
+        
+        Returns:
+            Path to the common git directory, or None if the git directory
+            is unknown
+        """
+        if self._git_dir is None:
+            return None
+        try:
+            with open(os.path.join(self._git_dir, 'commondir')) as f:
+                return os.path.join(self._git_dir, f.readline().strip())
+        except OSError:
+            return self._git_dir
+    
+    def _ref_stamp(self, include_remotes: bool) -> Optional[Tuple[Tuple[str, int, int, int], ...]]:
+        """Get a stamp of the files that branch refs and checkouts are stored in.
+        
+        Covers every loose branch ref, packed-refs (or a reftable's table
+        list) and the HEAD of each worktree. Git replaces these files by
+        renaming a new file over them, so any ref update, creation or
+        deletion changes an inode, mtime or the set of paths, and an
+        unchanged stamp means git for-each-ref would return the same
+        output.
+        
+        Args:
+            include_remotes: Also cover remote-tracking refs
+            
+        Returns:
+            (path, inode, mtime_ns, size) for each file, or None if the git
+            directory is unknown
+        """
+        if self._git_common_dir is None:
+            return None
+        entries = []
+        
+        def add(path: str) -> None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return
+            entries.append((path, st.st_ino, st.st_mtime_ns, st.st_size))
+        
+        add(os.path.join(self._git_common_dir, 'HEAD'))
+        add(os.path.join(self._git_common_dir, 'packed-refs'))
+        add(os.path.join(self._git_common_dir, 'reftable', 'tables.list'))
+        try:
+            with os.scandir(os.path.join(self._git_common_dir, 'worktrees')) as it:
+                for entry in it:
+                    add(os.path.join(entry.path, 'HEAD'))
+        except OSError:
+            pass
+        
+        dirs = [os.path.join(self._git_common_dir, 'refs', 'heads')]
+        if include_remotes:
+            dirs.append(os.path.join(self._git_common_dir, 'refs', 'remotes'))
+        while dirs:
+            try:
+                with os.scandir(dirs.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry.path)
+                        else:
+                            st = entry.stat(follow_symlinks=False)
+                            entries.append((entry.path, st.st_ino, st.st_mtime_ns, st.st_size))
+            except OSError:
+                pass
+        return tuple(entries)
+    
+    def _status_stamp(self) -> Optional[Tuple[Tuple[int, int], ...]]:
+        """Get the modification stamps of the index and HEAD.
         
+        Staging, committing, stashing and checking out all rewrite one of
+        these files, so a changed stamp means a cached uncommitted changes result
+        is stale even if its TTL hasn't run out.
+        
+        Returns:
+            (mtime_ns, size) pairs for the index and HEAD, or None if the
+            git directory is unknown
+        """
+        if self._git_dir is None:
+            return None
+        stamp = []
+        for name in ('index', 'HEAD'):
+            try:
+                st = os.stat(os.path.join(self._git_dir, name))
+                stamp.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamp.append((0, 0))
+        return tuple(stamp)
+        
+    @property
+    def current_user(self) -> Optional[str]:
+        """Email of the git user, looked up the first time the author filter needs it."""
+        if not self._current_user_loaded:
+            self._current_user = self._get_current_user()
+            self._current_user_loaded = True
+        return self._current_user
+    
     def _get_current_user(self) -> Optional[str]:
         """Get the current git user email.
         
@@ -647,174 +1090,440 @@ class GitBranchManager:
         except subprocess.CalledProcessError:
             return None
         
-    def get_branch_info(self, branch: str, is_remote: bool = False, remote_name: Optional[str] = None) -> Optional[BranchInfo]:
-        """Get commit info for a specific branch."""
-        try:
-            # Get commit hash, date, message, and author email
-            result = self._run_command(
-                ["git", "log", "-1", "--format=%H|%at|%s|%ae", branch],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            if result.stdout.strip():
-                parts = result.stdout.strip().split('|', 3)
-                if len(parts) == 4:
-                    commit_hash = parts[0][:12]  # Short hash
-                    commit_timestamp = int(parts[1])
-                    commit_date = datetime.fromtimestamp(commit_timestamp)
-                    commit_message = parts[2]
-                    commit_author = parts[3]
-                    
-                    # Check for uncommitted changes only on current branch
-                    has_uncommitted_changes = False
-                    if branch == self.current_branch:
-                        status_result = self._run_command(
-                            ["git", "status", "--porcelain"],
-                            capture_output=True,
-                            text=True,
-                            check=True
-                        )
-                        has_uncommitted_changes = bool(status_result.stdout.strip())
-                    
-                    return BranchInfo(
-                        name=branch,
-                        is_current=(branch == self.current_branch),
-                        commit_hash=commit_hash,
-                        commit_date=commit_date,
-                        commit_message=commit_message,
-                        commit_author=commit_author,
-                        has_uncommitted_changes=has_uncommitted_changes,
-                        is_remote=is_remote,
-                        remote_name=remote_name
-                    )
-            return None
-            
-        except subprocess.CalledProcessError:
-            return None
+    def _get_local_branch_info(self) -> Tuple[str, Dict[str, Dict]]:
+        """Get the current branch and info for all local branches in one git command.
+        
+        Returns:
+            Tuple of (current branch name or '' if detached, dict mapping
+            branch name to its info) newest commit first
+        """
+        current_branch, branch_data, _ = self._get_branch_refs(include_remotes=False)
+        return current_branch, branch_data
     
-    def _get_batch_branch_info(self, branches: List[Tuple[str, bool, Optional[str]]], worktree_branches: set = None) -> Dict[str, Dict]:
-        """Get branch info for multiple branches in a single git command."""
-        if not branches:
-            return {}
+    def _get_branch_refs(self, include_remotes: bool) -> Tuple[str, Dict[str, Dict], Dict[str, Dict]]:
+        """Get the current branch and info for local and remote branches in one git command.
+        
+        Uses a single git for-each-ref over refs/heads/ (and refs/remotes/
+        when requested) instead of separate git branch --show-current,
+        git branch, git branch -r and per-branch lookups. The %(HEAD)
+        marker identifies the current branch, the full refname tells local
+        and remote branches apart, %(worktreepath) identifies branches
+        checked out in other worktrees and %(symref) skips remote symbolic
+        refs such as origin/HEAD. Fields are NUL-separated so commit
+        subjects containing '|' parse correctly. git sorts the refs by
+        commit date itself, so callers only merge the local and remote
+        lists rather than sorting them in Python.
+        
+        When remote branches are listed their names are also cached, so the
+        upstream check doesn't run git branch -r. With use_pygit2 enabled
+        in the config the refs are read in-process instead, falling back
+        to git for-each-ref if pygit2 is missing or fails.
         
-        # Build format string for git for-each-ref
-        format_str = "%(refname:short)|%(objectname:short)|%(committerdate:unix)|%(subject)|%(authoremail)"
+        Args:
+            include_remotes: Also list remote-tracking branches
+            
+        Returns:
+            Tuple of (current branch name or '' if detached, dict mapping
+            local branch name to its info, dict mapping remote branch name
+            such as origin/main to its info), each newest commit first with
+            ties in refname order
+        """
+        # Reuse the last result while none of the ref files have changed;
+        # the stamp is taken first so a change during the command isn't missed
+        stamp = self._ref_stamp(include_remotes)
+        if stamp is not None and self._ref_cache is not None and self._ref_cache[0] == (include_remotes, stamp):
+            current_branch, branch_data, remote_data = self._ref_cache[1]
+            if include_remotes and self.cache:
+                self.cache.set('remote_branches', list(remote_data))
+            return current_branch, dict(branch_data), dict(remote_data)
+        
+        refs = None
+        if self.config.get('use_pygit2') and not self._pygit2_failed:
+            refs = self._read_branch_refs_pygit2(include_remotes)
+        if refs is None:
+            refs = self._read_branch_refs_git(include_remotes)
+        current_branch, branch_data, remote_data = refs
+        
+        if include_remotes and self.cache:
+            self.cache.set('remote_branches', list(remote_data))
+        if stamp is not None:
+            self._ref_cache = ((include_remotes, stamp), (current_branch, dict(branch_data), dict(remote_data)))
+        return current_branch, branch_data, remote_data
+    
+    def _read_branch_refs_git(self, include_remotes: bool) -> Tuple[str, Dict[str, Dict], Dict[str, Dict]]:
+        """Read branch refs with git for-each-ref for _get_branch_refs.
         
-        # Get info for all branches at once
-        branch_names = [b[0] for b in branches]
+        The output is parsed line by line while git is still writing it,
+        so with many refs the parsing overlaps git reading the commits
+        instead of starting once the whole listing has been buffered.
         
-        # Use git for-each-ref which is much faster than individual git log commands
-        cmd = ["git", "for-each-ref", f"--format={format_str}"]
+        Args:
+            include_remotes: Also list remote-tracking branches
+            
+        Returns:
+            Same tuple as _get_branch_refs
+            
+        Raises:
+            subprocess.CalledProcessError: If git for-each-ref fails
+        """
+        format_str = "%(HEAD)%00%(refname)%00%(objectname:short)%00%(committerdate:unix)%00%(authoremail)%00%(worktreepath)%00%(symref)%00%(subject)"
+        # Newest commit first, ties in refname order; the last --sort is the primary key
+        cmd = ["git", "for-each-ref", "--sort=refname", "--sort=-committerdate", f"--format={format_str}", "refs/heads/"]
+        if include_remotes:
+            cmd.append("refs/remotes/")
+        kwargs = {'stdout': subprocess.PIPE, 'stderr': subprocess.DEVNULL}
+        process = subprocess.Popen(self._prepare_command(cmd, kwargs), **kwargs)
+        
+        current_branch = ""
+        branch_data = {}
+        remote_data = {}
+        # Split the raw bytes and decode only the text fields as UTF-8 (git's
+        # default for refs and subjects); the timestamp is parsed straight
+        # from bytes and the HEAD marker, worktree path and symref are only tested
+        with process:
+            for line in process.stdout:
+                parts = line.rstrip(b'\n').split(b'\0', 7)
+                if len(parts) != 8:
+                    continue
+                head, ref_name, commit_hash, timestamp, author_email, worktree_path, symref, message = parts
+                
+                # Strip angle brackets from email if present
+                if author_email.startswith(b'<') and author_email.endswith(b'>'):
+                    author_email = author_email[1:-1]
+                
+                info = {
+                    'hash': commit_hash.decode('ascii'),
+                    'timestamp': int(timestamp),
+                    'message': message.decode('utf-8', 'replace'),
+                    'author': author_email.decode('utf-8', 'replace')
+                }
+                
+                if ref_name.startswith(b'refs/heads/'):
+                    branch_name = ref_name[11:].decode('utf-8', 'replace')
+                    is_current = head == b'*'
+                    if is_current:
+                        current_branch = branch_name
+                    info['in_worktree'] = bool(worktree_path) and not is_current
+                    branch_data[branch_name] = info
+                elif not symref:
+                    remote_data[ref_name[13:].decode('utf-8', 'replace')] = info
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, cmd)
+        
+        return current_branch, branch_data, remote_data
+    
+    def _read_branch_refs_pygit2(self, include_remotes: bool) -> Optional[Tuple[str, Dict[str, Dict], Dict[str, Dict]]]:
+        """Read branch refs in-process with pygit2 for _get_branch_refs.
         
-        # Add ref patterns for the branches we want
-        ref_patterns = []
-        for branch_name, is_remote, _ in branches:
-            if is_remote:
-                ref_patterns.append(f"refs/remotes/{branch_name}")
-            else:
-                ref_patterns.append(f"refs/heads/{branch_name}")
+        Produces the same data as _read_branch_refs_git without starting
+        git, which helps where process creation is slow. pygit2 is an
+        optional dependency imported on first use; if it is missing or
+        can't read the repository, this returns None and later calls go
+        straight to git.
         
-        cmd.extend(ref_patterns)
+        Args:
+            include_remotes: Also list remote-tracking branches
+            
+        Returns:
+            Same tuple as _get_branch_refs, or None if pygit2 can't be used
+        """
+        try:
+            import pygit2
+        except ImportError:
+            self._pygit2_failed = True
+            return None
         
+        prefixes = ('refs/heads/', 'refs/remotes/') if include_remotes else ('refs/heads/',)
         try:
-            result = self._run_command(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            repo = pygit2.Repository(self.working_dir)
+            head = repo.lookup_reference('HEAD')
+            head_target = head.target if isinstance(head.target, str) else None
             
+            current_branch = ""
             branch_data = {}
-            for line in result.stdout.strip().split('\n'):
-                if line:
-                    parts = line.split('|', 4)
-                    if len(parts) == 5:
-                        ref_name = parts[0]
-                        # Extract branch name from ref
-                        if ref_name.startswith('refs/heads/'):
-                            branch_name = ref_name[11:]  # Remove 'refs/heads/'
-                        elif ref_name.startswith('refs/remotes/'):
-                            branch_name = ref_name[13:]  # Remove 'refs/remotes/'
-                        else:
-                            branch_name = ref_name
-                        
-                        # Strip angle brackets from email if present
-                        author_email = parts[4]
-                        if author_email.startswith('<') and author_email.endswith('>'):
-                            author_email = author_email[1:-1]
-                        
-                        branch_data[branch_name] = {
-                            'hash': parts[1],
-                            'timestamp': int(parts[2]),
-                            'message': parts[3],
-                            'author': author_email
-                        }
-            
-            return branch_data
+            remote_data = {}
+            # Sorted by refname as a tiebreak; code point order matches git's byte order
+            for ref_name in sorted(name for name in repo.listall_references() if name.startswith(prefixes)):
+                ref = repo.lookup_reference(ref_name)
+                is_local = ref_name.startswith('refs/heads/')
+                # Symbolic refs have a str target; skip remote ones such as origin/HEAD
+                if not is_local and isinstance(ref.target, str):
+                    continue
+                try:
+                    commit = ref.peel(pygit2.Commit)
+                except (pygit2.GitError, KeyError, ValueError):
+                    continue
+                
+                info = {
+                    'hash': commit.short_id,
+                    'timestamp': commit.commit_time,
+                    'message': self._commit_subject(commit.raw_message),
+                    'author': commit.author.raw_email.decode('utf-8', 'replace')
+                }
+                if is_local:
+                    branch_name = ref_name[11:]
+                    if ref_name == head_target:
+                        current_branch = branch_name
+                    branch_data[branch_name] = info
+                else:
+                    remote_data[ref_name[13:]] = info
+        except (pygit2.GitError, KeyError, ValueError, OSError):
+            self._pygit2_failed = True
+            return None
+        
+        # Newest commit first like --sort=-committerdate; the sort is stable so ties stay in refname order
+        branch_data = dict(sorted(branch_data.items(), key=lambda item: -item[1]['timestamp']))
+        remote_data = dict(sorted(remote_data.items(), key=lambda item: -item[1]['timestamp']))
+        
+        # Branches checked out in any worktree, read from the HEAD files git keeps for each
+        worktree_refs = set()
+        if self._git_common_dir:
+            head_paths = [os.path.join(self._git_common_dir, 'HEAD')]
+            try:
+                with os.scandir(os.path.join(self._git_common_dir, 'worktrees')) as entries:
+                    head_paths.extend(os.path.join(entry.path, 'HEAD') for entry in entries if entry.is_dir())
+            except OSError:
+                pass
+            for path in head_paths:
+                try:
+                    with open(path) as f:
+                        line = f.readline().strip()
+                except OSError:
+                    continue
+                if line.startswith('ref: '):
+                    worktree_refs.add(line[5:])
+        for branch_name, info in branch_data.items():
+            info['in_worktree'] = branch_name != current_branch and 'refs/heads/' + branch_name in worktree_refs
+        
+        return current_branch, branch_data, remote_data
+    
+    @staticmethod
+    def _commit_subject(raw_message: bytes) -> str:
+        """Extract a commit subject the way git's %(subject) does.
+        
+        Leading blank lines are skipped and the lines of the first
+        paragraph are joined with spaces.
+        
+        Args:
+            raw_message: Raw commit message bytes
             
-        except subprocess.CalledProcessError:
-            return {}
+        Returns:
+            The subject decoded as UTF-8
+        """
+        lines = []
+        for line in raw_message.split(b'\n'):
+            line = line.rstrip()
+            if line:
+                lines.append(line)
+            elif lines:
+                break
+        return b' '.join(lines).decode('utf-8', 'replace')
     
     def _check_uncommitted_changes_batch(self) -> bool:
         """Check if current branch has uncommitted changes.
         
-        Uses git status --porcelain for a machine-readable output format.
+        Uses git diff --quiet for unstaged and then staged changes rather
+        than git status: both stop at the first difference instead of
+        listing every changed path, and neither looks at untracked files,
+        which git stash push leaves alone and so never warrant the stash
+        prompt. Unlike plumbing diff-index they compare contents, so files
+        that were only touched aren't reported.
         
         Returns:
             True if there are uncommitted changes, False otherwise
         """
-        try:
-            status_result = self._run_command(
-                ["git", "status", "--porcelain"],
-                capture_output=True,
-                text=True,
-                check=True
+        for cmd in (["git", "diff", "--quiet", "--no-ext-diff"], ["git", "diff", "--cached", "--quiet", "--no-ext-diff"]):
+            result = self._run_command(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False
             )
-            return bool(status_result.stdout.strip())
-        except subprocess.CalledProcessError:
-            return False
+            # Exit code 1 means there are differences; anything else but 0 is an error
+            if result.returncode == 1:
+                return True
+        return False
+    
+    def _has_uncommitted_changes(self, refresh: bool = False) -> bool:
+        """Check for uncommitted changes, reusing the cached result if available.
+        
+        Only changes to tracked files count: the check runs git diff --quiet
+        and git diff --cached --quiet (see _check_uncommitted_changes_batch),
+        so untracked files are ignored. A cached result is only reused
+        while the index and HEAD stamps match the ones taken before it was
+        computed. Edits to tracked files don't touch either file, so the
+        TTL still bounds how long a result is trusted.
+        
+        Args:
+            refresh: Run the git diff checks even if a cached result is available
+            
+        Returns:
+            True if there are uncommitted changes, False otherwise
+        """
+        stamp = self._status_stamp()
+        if self.cache and not refresh:
+            cached_uncommitted = self.cache.get('uncommitted_changes')
+            if cached_uncommitted is not None and cached_uncommitted[0] == stamp:
+                return cached_uncommitted[1]
+        
+        has_uncommitted = self._check_uncommitted_changes_batch()
+        if self.cache:
+            self.cache.set('uncommitted_changes', (stamp, has_uncommitted))
+        return has_uncommitted
+    
+    def prefetch_uncommitted_changes(self) -> None:
+        """Start the uncommitted changes check ahead of the first branch load.
+        
+        Called before curses starts, so the check overlaps the repository
+        check and terminal setup instead of running when the list loads.
+        """
+        self._uncommitted_future = self._status_executor.submit(self._has_uncommitted_changes)
+    
+    def _start_uncommitted_check(self) -> Future:
+        """Get a future for the uncommitted changes check.
+        
+        Returns:
+            The prefetched check if one is pending, otherwise a newly
+            submitted one
+        """
+        future, self._uncommitted_future = self._uncommitted_future, None
+        return future or self._status_executor.submit(self._has_uncommitted_changes)
     
-    def _get_remote_branches_set(self) -> set:
+    def _get_remote_branches_set(self, remote_names: Optional[List[str]] = None) -> set:
         """Get a set of all branch names that exist on any remote.
         
         Used to determine which local branches have been pushed (have upstream).
         Strips remote prefixes to get just branch names.
         
+        Args:
+            remote_names: Remote branch names already listed by the caller,
+                or None to look them up
+        
         Returns:
             Set of branch names (without remote prefix) that exist on remotes
         """
         remote_branches = set()
         try:
+            for branch in (remote_names if remote_names is not None else self._get_remote_branch_names()):
+                # Extract just the branch name (remove remote prefix)
+                if '/' in branch:
+                    remote_branches.add(branch.split('/', 1)[1])
+            
+        except subprocess.CalledProcessError:
+            pass
+        
+        return remote_branches
+    
+    def _get_remote_branch_names(self) -> List[str]:
+        """Get the names of all remote-tracking branches.
+        
+        Reads the ref files directly when it can (see
+        _read_remote_branch_names), otherwise uses git branch -r --format so
+        names come back already parsed. Symbolic refs such as origin/HEAD
+        are skipped either way. While the remote branch listing started by
+        get_branches_progressive is still running, its result is awaited
+        instead of listing the same refs a second time.
+        
+        Returns:
+            List of remote branch names including the remote prefix (e.g. origin/main)
+            
+        Raises:
+            subprocess.CalledProcessError: If the git command fails
+        """
+        if self.cache:
+            cached_names = self.cache.get('remote_branches')
+            if cached_names is not None:
+                return cached_names
+        
+        future = self._remote_refs_future
+        if future is not None:
+            try:
+                return list(future.result()[2])
+            except Exception:
+                pass  # List them below instead
+        
+        remote_names = self._read_remote_branch_names()
+        if remote_names is None:
             result = self._run_command(
-                ["git", "branch", "-r"],
+                ["git", "branch", "-r", "--format=%(refname:lstrip=2)%00%(symref)"],
                 capture_output=True,
-                text=True,
                 check=True
             )
             
-            for line in result.stdout.strip().split('\n'):
-                if line.strip():
-                    branch = line.strip()
-                    # Skip HEAD pointer
-                    if '->' in branch:
-                        continue
-                    # Extract just the branch name (remove remote prefix)
-                    if '/' in branch:
-                        branch_name = branch.split('/', 1)[1]
-                        remote_branches.add(branch_name)
-            
-        except subprocess.CalledProcessError:
+            remote_names = []
+            for line in result.stdout.split(b'\n'):
+                parts = line.split(b'\0', 1)
+                if len(parts) == 2 and not parts[1]:
+                    remote_names.append(parts[0].decode('utf-8', 'replace'))
+        
+        if self.cache:
+            self.cache.set('remote_branches', remote_names)
+        return remote_names
+    
+    def _read_remote_branch_names(self) -> Optional[List[str]]:
+        """Read remote-tracking branch names from the ref files without spawning git.
+        
+        Only names are needed for the upstream check, so instead of running
+        git branch -r this lists the loose refs under refs/remotes/ and the
+        refs/remotes/ entries of packed-refs. Loose files starting with
+        "ref:" are symbolic refs such as origin/HEAD and are skipped, as
+        are *.lock files left by a concurrent fetch and files removed
+        while the directory is scanned; packed-refs never holds symbolic
+        refs.
+        
+        Returns:
+            Sorted remote branch names including the remote prefix, or None
+            if the refs can't be read this way (unknown git directory, or a
+            repository using the reftable format)
+        """
+        if self._git_common_dir is None or os.path.isdir(os.path.join(self._git_common_dir, 'reftable')):
+            return None
+        
+        names = set()
+        try:
+            with open(os.path.join(self._git_common_dir, 'packed-refs'), 'rb') as f:
+                for line in f:
+                    # "<hash> refs/remotes/<remote>/<branch>"; skip the header and peeled "^<hash>" lines
+                    parts = line.rstrip(b'\n').split(b' ', 1)
+                    if len(parts) == 2 and parts[1].startswith(b'refs/remotes/'):
+                        names.add(parts[1][13:].decode('utf-8', 'replace'))
+        except FileNotFoundError:
             pass
+        except OSError:
+            return None
         
-        return remote_branches
+        remotes_dir = os.path.join(self._git_common_dir, 'refs', 'remotes')
+        dirs = [remotes_dir]
+        while dirs:
+            try:
+                with os.scandir(dirs.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry.path)
+                            continue
+                        # Lock files are written by a fetch or update still in progress
+                        if entry.name.endswith('.lock'):
+                            continue
+                        try:
+                            with open(entry.path, 'rb') as f:
+                                if f.read(4) == b'ref:':
+                                    continue
+                        except FileNotFoundError:
+                            # Pruned or packed since the directory was listed
+                            continue
+                        names.add(os.path.relpath(entry.path, remotes_dir).replace(os.sep, '/'))
+            except FileNotFoundError:
+                pass
+            except OSError:
+                return None
+        return sorted(names)
     
     def _get_branch_stashes(self, branch_name: str) -> List[Tuple[str, str]]:
         """Get stashes that were created by git-branch-manager from the specified branch.
         
         Only returns stashes with the message "Stashed by git-branch-manager"
-        to avoid interfering with user-created stashes.
+        to avoid interfering with user-created stashes. The stash list is
+        matched as bytes and only the matching entries are decoded.
         
         Args:
             branch_name: Name of the branch to find stashes for
@@ -826,20 +1535,18 @@ class GitBranchManager:
         try:
             # Get all stashes with their branch info
             result = self._run_command(
-                ["git", "stash", "list", "--format=%gd|%s"],
+                ["git", "stash", "list", "--format=%gd%x00%s"],
                 capture_output=True,
-                text=True,
                 check=True
             )
             
-            if result.stdout.strip():
-                for line in result.stdout.strip().split('\n'):
-                    if '|' in line:
-                        stash_ref, message = line.split('|', 1)
-                        # Only match stashes created by git-branch-manager
-                        # Format: "On branch_name: Stashed by git-branch-manager"
-                        if f"On {branch_name}: Stashed by git-branch-manager" in message:
-                            stashes.append((stash_ref, message))
+            # Only match stashes created by git-branch-manager
+            # Format: "On branch_name: Stashed by git-branch-manager"
+            marker = f"On {branch_name}: Stashed by git-branch-manager".encode('utf-8')
+            for line in result.stdout.split(b'\n'):
+                if marker in line and b'\0' in line:
+                    stash_ref, message = line.split(b'\0', 1)
+                    stashes.append((stash_ref.decode('utf-8', 'replace'), message.decode('utf-8', 'replace')))
             
         except subprocess.CalledProcessError:
             pass
@@ -862,19 +1569,12 @@ class GitBranchManager:
         try:
             # Get branches merged into the base branch
             result = self._run_command(
-                ["git", "branch", "--merged", base_branch],
+                ["git", "branch", "--merged", base_branch, "--format=%(refname:lstrip=2)"],
                 capture_output=True,
-                text=True,
                 check=True
             )
             
-            for line in result.stdout.strip().split('\n'):
-                if line.strip():
-                    branch = line.strip()
-                    # Remove the * prefix for current branch
-                    if branch.startswith('* '):
-                        branch = branch[2:]
-                    merged_branches.add(branch)
+            merged_branches.update(line.decode('utf-8', 'replace') for line in result.stdout.split(b'\n') if line)
             
         except subprocess.CalledProcessError:
             pass
@@ -896,24 +1596,294 @@ class GitBranchManager:
         if branch_name == base_branch:
             return (0, 0)
         
-        try:
-            result = self._run_command(
-                ["git", "rev-list", "--left-right", "--count", f"{base_branch}...{branch_name}"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            # Output format is "behind\tahead"
-            parts = result.stdout.strip().split('\t')
-            if len(parts) == 2:
-                behind = int(parts[0])
-                ahead = int(parts[1])
-                return (ahead, behind)
-        except (subprocess.CalledProcessError, ValueError):
-            pass
-        
-        return (0, 0)
+        # Runs once per branch without batched counts, so a failing branch (e.g. no
+        # common history with the base) is a return code check rather than an exception
+        result = self._run_command(
+            ["git", "rev-list", "--left-right", "--count", f"{base_branch}...{branch_name}"],
+            capture_output=True,
+            check=False
+        )
+        if result.returncode != 0:
+            return (0, 0)
+        
+        # Output format is "behind\tahead"; the counts are ASCII, so int() parses the bytes directly
+        parts = result.stdout.strip().split(b'\t')
+        if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
+            return (int(parts[1]), int(parts[0]))
+        
+        return (0, 0)
+    
+    def _get_commit_counts_batch(self, base_branch: str) -> Optional[Dict[str, Tuple[int, int]]]:
+        """Get ahead/behind counts for all local branches in a single git command.
+        
+        Uses the %(ahead-behind) atom of git for-each-ref (git 2.41+) instead
+        of one git rev-list per branch. Remembers when git is too old to
+        support it so the per-branch fallback is used without retrying.
+        Any other failure, such as a base branch that doesn't exist, gives
+        an empty result that callers cache like any other, so enrichment
+        neither repeats the command nor falls back to rev-list, which
+        would fail the same way.
+        
+        Args:
+            base_branch: The base branch to compare against (typically main/master)
+            
+        Returns:
+            Dict mapping branch name to (commits_ahead, commits_behind),
+            empty if the counts can't be computed against base_branch, or
+            None if the installed git does not support batched counts
+        """
+        if not self._ahead_behind_supported:
+            return None
+        
+        try:
+            result = self._run_command(
+                ["git", "for-each-ref", f"--format=%(refname:lstrip=2)%00%(ahead-behind:{base_branch})", "refs/heads/"],
+                capture_output=True,
+                check=True
+            )
+        except subprocess.CalledProcessError as e:
+            if b'ahead-behind' in (e.stderr or b''):
+                self._ahead_behind_supported = False
+                return None
+            return {}
+        
+        counts = {}
+        for line in result.stdout.split(b'\n'):
+            parts = line.split(b'\0', 1)
+            if len(parts) == 2:
+                ahead_behind = parts[1].split()
+                if len(ahead_behind) == 2:
+                    counts[parts[0].decode('utf-8', 'replace')] = (int(ahead_behind[0]), int(ahead_behind[1]))
+        
+        return counts
+    
+    def _get_branch_row(self, branch_info: BranchInfo, width: int, loading: bool, now: int) -> Tuple[str, Tuple[Tuple[int, int, int], ...]]:
+        """Get the formatted display line and colored spans for a branch row.
+        
+        Rows are cached per branch and only rebuilt when the branch info,
+        its loading state, or the terminal width changes, so moving the
+        selection does not reformat every visible row. Span offsets and
+        lengths are computed and clipped to the width here, so drawing a
+        row is one write plus one recolor per span with no arithmetic.
+        
+        Args:
+            branch_info: Branch to format
+            width: Terminal width used to truncate the commit message
+            loading: Whether the branch is still being enriched
+            now: Unix time of the current redraw, used for the commit age
+            
+        Returns:
+            Tuple of (full line text, tuple of (x, length, color pair) spans
+            for the parts not drawn in the default color)
+        """
+        if width != self._row_cache_width:
+            self._row_cache.clear()
+            self._row_cache_width = width
+        
+        cached = self._row_cache.get(branch_info.name)
+        if cached is not None and cached[0] is branch_info and cached[1] == loading:
+            return cached[2]
+        
+        # Prepare display components
+        if branch_info.is_current:
+            prefix = "* "
+        elif branch_info.is_remote:
+            prefix = "↓ "  # Down arrow for remote branches
+        else:
+            prefix = "  "
+        relative_date = branch_info.relative_date or format_relative_age(now - branch_info.commit_timestamp)
+        date_color = branch_info.date_color or age_color(now - branch_info.commit_timestamp)
+        
+        segments = [(prefix, 0), (branch_info.name, 2 if branch_info.is_current else 4)]
+        
+        # Status indicators
+        if branch_info.has_uncommitted_changes:
+            segments.append((" [modified]", 3))
+        if not branch_info.is_remote and not branch_info.has_upstream:
+            segments.append((" [unpushed]", 3))
+        if branch_info.is_merged and not branch_info.is_current and not branch_info.is_remote:
+            segments.append((" [merged]", 2))
+        if branch_info.in_worktree and not branch_info.is_current:
+            segments.append((" [worktree]", 4))
+        
+        # Commit count indicator - green if only ahead, yellow if only behind, magenta if both
+        if not branch_info.is_remote:
+            if branch_info.commits_ahead > 0 and branch_info.commits_behind > 0:
+                segments.append((f" [+{branch_info.commits_ahead}/-{branch_info.commits_behind}]", 5))
+            elif branch_info.commits_ahead > 0:
+                segments.append((f" [+{branch_info.commits_ahead}]", 2))
+            elif branch_info.commits_behind > 0:
+                segments.append((f" [-{branch_info.commits_behind}]", 3))
+        
+        if loading:
+            segments.append((" ↻", 4))
+        
+        segments.append((_SEPARATOR, 0))
+        segments.append((relative_date, date_color))
+        segments.append((_SEPARATOR, 0))
+        segments.append((branch_info.commit_hash, 6))
+        segments.append((_SEPARATOR, 0))
+        
+        # Truncate the commit message to the space left on the row
+        max_msg_len = width - sum(len(text) for text, _ in segments) - 1
+        commit_msg = branch_info.commit_message
+        if len(commit_msg) > max_msg_len and max_msg_len > 3:
+            commit_msg = commit_msg[:max_msg_len-3] + "..."
+        segments.append((commit_msg, 0))
+        
+        # Position each segment, clipping to the row width (leaving a 1 char margin).
+        # Neighbouring segments of the same color are merged so they draw as one call,
+        # and default-colored text needs no span as the line is written in it
+        spans = []
+        texts = []
+        x_pos = 0
+        limit = width - 1
+        last_color = None
+        for text, color in segments:
+            if x_pos >= limit:
+                break
+            text = text[:limit - x_pos]
+            texts.append(text)
+            length = len(text)
+            if color != last_color:
+                if color:
+                    spans.append((x_pos, length, color))
+                last_color = color
+            elif color:
+                start, previous, _ = spans[-1]
+                spans[-1] = (start, previous + length, color)
+            x_pos += length
+        
+        row = ("".join(texts), tuple(spans))
+        self._row_cache[branch_info.name] = (branch_info, loading, row)
+        return row
+    
+    def _draw_branch_row(self, stdscr, y: int, branch_index: int, width: int, now: int,
+                         drawn_rows: Dict[int, Tuple[Tuple[str, Tuple[Tuple[int, int, int], ...]], bool]]) -> None:
+        """Draw one row of the branch list, unless the screen already shows it.
+        
+        Args:
+            stdscr: Curses screen object
+            y: Screen row to draw on
+            branch_index: Index into the filtered branch list
+            width: Terminal width
+            now: Unix time of the current redraw, used for the commit age
+            drawn_rows: Cached row and selection drawn on each screen row,
+                checked and updated here
+        """
+        branch_info = self.filtered_branches[branch_index]
+        loading = not branch_info.is_remote and branch_info.name in self.enrichment_in_progress
+        row = self._get_branch_row(branch_info, width, loading, now)
+        selected = branch_index == self.selected_index
+        
+        # Cached rows are only rebuilt when they change, so identity tells whether this row is already on screen
+        drawn = drawn_rows.get(y)
+        if drawn is not None and drawn[0] is row and drawn[1] == selected:
+            return
+        drawn_rows[y] = (row, selected)
+        
+        line, spans = row
+        try:
+            stdscr.move(y, 0)
+            stdscr.clrtoeol()
+            if selected:
+                # Selected row - one inverse video write padded to the full width
+                stdscr.addnstr(y, 0, line.ljust(width - 1), width - 1, self._color_pairs[1])
+            else:
+                # Non-selected rows - the whole line in one write, then recolor
+                # the colored spans; bound locally as this runs once per span
+                stdscr.addstr(y, 0, line)
+                chgat = stdscr.chgat
+                color_pairs = self._color_pairs
+                for x_pos, length, color in spans:
+                    chgat(y, x_pos, length, color_pairs[color])
+        except curses.error:
+            pass
+    
+    def _read_queued_arrow_keys(self, stdscr, key: int) -> int:
+        """Coalesce a burst of Up/Down key presses into one selection move.
+        
+        Reads keys without blocking until the input queue is empty or holds
+        something other than an arrow key, which is pushed back for the
+        main loop to handle after the redraw.
+        
+        Args:
+            stdscr: Curses screen object
+            key: The Up or Down key that started the burst
+            
+        Returns:
+            Net number of rows to move the selection (negative is up)
+        """
+        delta = -1 if key == curses.KEY_UP else 1
+        stdscr.nodelay(True)
+        try:
+            while True:
+                key = stdscr.getch()
+                if key == curses.KEY_UP:
+                    delta -= 1
+                elif key == curses.KEY_DOWN:
+                    delta += 1
+                else:
+                    if key != -1:
+                        curses.ungetch(key)
+                    break
+        finally:
+            stdscr.nodelay(False)
+        return delta
+    
+    def _get_rule(self, width: int) -> str:
+        """Get the full-width separator line, rebuilt only when the width changes.
+        
+        Args:
+            width: Terminal width
+            
+        Returns:
+            A line of box drawing characters one column narrower than the terminal
+        """
+        if len(self._rule) != max(0, width - 1):
+            self._rule = "─" * (width - 1)
+        return self._rule
+    
+    def _draw_scroll_indicator(self, stdscr, width: int, visible_branches: int) -> None:
+        """Show the selected position in the top right corner if the list scrolls.
+        
+        Args:
+            stdscr: Curses screen object
+            width: Terminal width
+            visible_branches: Number of branch rows that fit on screen
+        """
+        if len(self.filtered_branches) > visible_branches:
+            scroll_msg = f"[{self.selected_index + 1}/{len(self.filtered_branches)}]"
+            try:
+                stdscr.addstr(0, width - len(scroll_msg) - 1, scroll_msg, self._color_pairs[9])
+            except curses.error:
+                pass
+    
+    def _show_message(self, stdscr, lines: List[str]) -> int:
+        """Show a full-screen message and wait for a key press.
+        
+        The lines are drawn on an erased screen, clipped to the terminal
+        width so long error messages can't raise curses.error, and flushed
+        with a single doupdate right before blocking on the key.
+        
+        Args:
+            stdscr: Curses screen object
+            lines: Lines to show from the top of the screen, usually ending
+                with a "Press any key to continue..." prompt
+                
+        Returns:
+            The key that was pressed
+        """
+        height, width = stdscr.getmaxyx()
+        stdscr.erase()
+        for y, line in enumerate(lines[:height]):
+            try:
+                stdscr.addnstr(y, 0, line, width - 1)
+            except curses.error:
+                pass
+        stdscr.noutrefresh()
+        curses.doupdate()
+        return stdscr.getch()
     
     def safe_addstr(self, stdscr, y: int, x: int, text: str, attr: int = 0) -> int:
         """Safely add string to screen, truncating if necessary.
@@ -945,11 +1915,7 @@ class GitBranchManager:
             text = text[:available]
         
         try:
-            if attr:
-                stdscr.attron(attr)
-            stdscr.addstr(y, x, text)
-            if attr:
-                stdscr.attroff(attr)
+            stdscr.addnstr(y, x, text, available, attr)
         except curses.error:
             pass
         
@@ -976,24 +1942,8 @@ class GitBranchManager:
         if cwd.startswith(home):
             cwd = '~' + cwd[len(home):]
         
-        # Check if we're in a worktree
-        worktree_info = ""
-        try:
-            # Check if this is a worktree
-            result = self._run_command(
-                ["git", "rev-parse", "--show-toplevel"],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            if result.returncode == 0 and result.stdout:
-                git_dir = result.stdout.strip()
-                # Check if it's a worktree by looking for .git file (not directory)
-                git_path = os.path.join(git_dir, '.git')
-                if os.path.isfile(git_path):
-                    worktree_info = " [worktree]"
-        except:
-            pass
+        # Worktree status is detected once at startup rather than per redraw
+        worktree_info = " [worktree]" if self.is_worktree else ""
         
         # Line 0: Title bar with directory
         title = "Git Branch Manager"
@@ -1023,10 +1973,7 @@ class GitBranchManager:
         
         # Draw title bar with inverted colors
         try:
-            stdscr.attron(curses.color_pair(9))
-            stdscr.addstr(0, 0, " " * (width - 1))  # Clear line
-            stdscr.addstr(0, 0, title_bar[:width-1])
-            stdscr.attroff(curses.color_pair(9))
+            stdscr.addnstr(0, 0, title_bar.ljust(width - 1), width - 1, self._color_pairs[9])
         except curses.error:
             pass
         
@@ -1037,14 +1984,16 @@ class GitBranchManager:
             status_items.append("Remotes: ON")
         if self.last_stash_ref:
             status_items.append(f"Stash: {self.last_stash_ref}")
+        if self._fetch_future is not None:
+            status_items.append("Fetching from remote...")
         
         if status_items:
-            status_line = " • ".join(status_items)
+            status_line = _SEPARATOR.join(status_items)
             if len(status_line) > width - 1:
                 status_line = status_line[:width-4] + "..."
             
             try:
-                stdscr.addstr(current_y, 0, status_line[:width-1], curses.color_pair(8))
+                stdscr.addstr(current_y, 0, status_line[:width-1], self._color_pairs[8])
             except curses.error:
                 pass
             current_y += 1
@@ -1067,13 +2016,13 @@ class GitBranchManager:
             if len(filter_line) > width - 1:
                 filter_line = filter_line[:width-4] + "..."
             try:
-                stdscr.addstr(current_y, 0, filter_line[:width-1], curses.color_pair(3))
+                stdscr.addstr(current_y, 0, filter_line[:width-1], self._color_pairs[3])
             except curses.error:
                 pass
             current_y += 1
         
         # Separator line with branch count
-        separator = "─" * (width - 1)
+        separator = self._get_rule(width)
         
         # Add branch count to separator if there's room
         branch_count_text = f" {len(self.filtered_branches)} branches "
@@ -1086,7 +2035,7 @@ class GitBranchManager:
             separator = separator[:mid_point] + branch_count_text + separator[mid_point + len(branch_count_text):]
         
         try:
-            stdscr.addstr(current_y, 0, separator[:width-1], curses.color_pair(8))
+            stdscr.addstr(current_y, 0, separator[:width-1], self._color_pairs[8])
         except curses.error:
             pass
         
@@ -1111,8 +2060,7 @@ class GitBranchManager:
         # Draw separator line with proper box drawing characters
         try:
             # Use box drawing characters for a more professional look
-            separator_line = "─" * (width - 1)
-            stdscr.addstr(separator_y, 0, separator_line, curses.color_pair(8))
+            stdscr.addstr(separator_y, 0, self._get_rule(width), self._color_pairs[8])
         except curses.error:
             pass
         
@@ -1155,15 +2103,13 @@ class GitBranchManager:
         
         # Draw footer with color
         try:
-            stdscr.attron(curses.color_pair(9))
-            # Clear the line first
-            stdscr.addstr(footer_y, 0, " " * (width - 1))
             # Center the text
             x_start = (width - len(footer_text)) // 2
             if x_start < 0:
                 x_start = 1
-            stdscr.addstr(footer_y, x_start, footer_text)
-            stdscr.attroff(curses.color_pair(9))
+            # Pad to the full line so the bar is drawn in a single call
+            footer_line = (" " * x_start + footer_text).ljust(width - 1)
+            stdscr.addnstr(footer_y, 0, footer_line, width - 1, self._color_pairs[9])
         except curses.error:
             pass
     
@@ -1234,6 +2180,60 @@ class GitBranchManager:
         
         return result[0]
     
+    def _start_fetch(self) -> None:
+        """Start fetching from all remotes without blocking the UI.
+        
+        The fetch runs on its own daemon thread rather than the executor,
+        so quitting mid-fetch doesn't wait for the network. The main loop
+        polls self._fetch_future and calls _finish_fetch once it is done.
+        """
+        future = Future()
+        
+        def fetch():
+            """Run the fetch and record its outcome on the future."""
+            try:
+                future.set_result(self._run_command(
+                    ["git", "fetch", "--all"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=True
+                ))
+            except Exception as e:
+                future.set_exception(e)
+        
+        self._fetch_future = future
+        threading.Thread(target=fetch, daemon=True).start()
+    
+    def _finish_fetch(self, stdscr) -> None:
+        """Reload branches after a background fetch, or report its failure.
+        
+        Args:
+            stdscr: Curses screen object
+        """
+        future, self._fetch_future = self._fetch_future, None
+        try:
+            future.result()
+        except Exception as e:
+            # Any error from the fetch thread, e.g. OSError when git can't be started
+            self._show_message(stdscr, [
+                f"Fetch failed: {e}",
+                "Press any key to continue..."
+            ])
+            return
+        
+        # Invalidate remote-related caches after fetch
+        if self.cache:
+            self.cache.invalidate('remote_branches')
+            self.cache.invalidate('remote_branches_set')
+            self.cache.invalidate_pattern('merged_branches')
+        
+        # Reload branches now that the fetch has finished
+        self.load_branches(stdscr)
+        
+        # Adjust selected index if needed
+        if self.selected_index >= len(self.filtered_branches):
+            self.selected_index = max(0, len(self.filtered_branches) - 1)
+    
     def show_loading_message(self, stdscr, message: str, spinner_frame: int = 0) -> None:
         """Show a loading message in the center of the screen with spinner.
         
@@ -1246,13 +2246,16 @@ class GitBranchManager:
             spinner_frame: Frame number for spinner animation (0-7)
         """
         if stdscr:
-            stdscr.clear()
+            stdscr.erase()
             height, width = stdscr.getmaxyx()
             
             # Spinner frames for a smooth animation
             spinners = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧"]
             spinner = spinners[spinner_frame % len(spinners)]
             
+            # Clip the message so it stays centered rather than disappearing on narrow terminals
+            message = message[:max(0, width - 3)]
+            
             # Combine spinner with message
             display_text = f"{spinner} {message}"
             
@@ -1263,9 +2266,7 @@ class GitBranchManager:
             if x >= 0 and y >= 0:
                 try:
                     # Draw the spinner in cyan color
-                    stdscr.attron(curses.color_pair(4))
-                    stdscr.addstr(y, x, spinner)
-                    stdscr.attroff(curses.color_pair(4))
+                    stdscr.addstr(y, x, spinner, self._color_pairs[4])
                     
                     # Draw the message
                     stdscr.addstr(y, x + 2, message)
@@ -1274,7 +2275,7 @@ class GitBranchManager:
                     hint = "This may take a moment..."
                     hint_x = (width - len(hint)) // 2
                     if hint_x >= 0 and y + 2 < height:
-                        stdscr.addstr(y + 2, hint_x, hint, curses.color_pair(8))
+                        stdscr.addstr(y + 2, hint_x, hint, self._color_pairs[8])
                     
                     stdscr.refresh()
                 except curses.error:
@@ -1290,128 +2291,80 @@ class GitBranchManager:
             stdscr: Optional curses screen object for updating display
         """
         try:
-            # Phase 1: Get basic branch info quickly
-            # Get current branch (cached)
-            current_branch = None
-            if self.cache:
-                current_branch = self.cache.get('current_branch')
-            
-            if not current_branch:
-                current_result = self._run_command(
-                    ["git", "branch", "--show-current"],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                current_branch = current_result.stdout.strip()
-                if self.cache:
-                    self.cache.set('current_branch', current_branch)
-            
-            self.current_branch = current_branch
-            self.branches = []
-            
-            # Collect all branch names first
-            all_branches = []
-            worktree_branches = set()
+            # The uncommitted changes check is independent of the ref queries below, so run it alongside them
+            uncommitted_future = self._start_uncommitted_check()
             
-            # Get local branches (cached)
+            # Phase 1: Get basic branch info quickly
+            # Current branch, local and remote branch info come from one cached call
             local_branches_data = None
+            remote_info = {}
             if self.cache:
                 local_branches_data = self.cache.get('local_branches')
+                if self.show_remotes:
+                    remote_info = self.cache.get('branch_info:remote')
             
-            if not local_branches_data:
-                result = self._run_command(
-                    ["git", "branch"],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                local_branches_data = result.stdout
+            # Remote refs can far outnumber local ones, so when they aren't cached
+            # they're listed in the background and merged in by the main loop,
+            # letting local branches paint first
+            remote_deferred = self.show_remotes and remote_info is None and stdscr is not None
+            if remote_deferred:
+                self._remote_refs_future = self._remote_refs_executor.submit(self._get_branch_refs, True)
+                remote_info = {}
+            
+            if self.show_remotes and not remote_deferred and (not local_branches_data or remote_info is None):
+                current_branch, local_info, remote_info = self._get_branch_refs(include_remotes=True)
+                local_branches_data = (current_branch, local_info)
+                if self.cache:
+                    self.cache.set('local_branches', local_branches_data)
+                    self.cache.set('branch_info:remote', remote_info)
+            elif not local_branches_data:
+                local_branches_data = self._get_local_branch_info()
                 if self.cache:
                     self.cache.set('local_branches', local_branches_data)
             
-            lines = local_branches_data.strip().split('\n') if local_branches_data.strip() else []
+            self.current_branch, local_info = local_branches_data
+            self.branches = []
             
-            for line in lines:
-                branch_name = line.strip()
-                if branch_name.startswith('* '):
-                    branch_name = branch_name[2:]
-                elif branch_name.startswith('+ '):
-                    branch_name = branch_name[2:]
-                    worktree_branches.add(branch_name)
-                all_branches.append((branch_name, False, None))
+            # Collect all branch names first
+            all_branches = [(name, False, None) for name in local_info]
+            worktree_branches = {name for name, info in local_info.items() if info['in_worktree']}
             
             # Get remote branches if enabled
+            remote_branches = []
             if self.show_remotes:
-                remote_branches_data = None
-                if self.cache:
-                    remote_branches_data = self.cache.get('remote_branches')
-                
-                if not remote_branches_data:
-                    remote_result = self._run_command(
-                        ["git", "branch", "-r"],
-                        capture_output=True,
-                        text=True,
-                        check=True
-                    )
-                    remote_branches_data = remote_result.stdout
-                    if self.cache:
-                        self.cache.set('remote_branches', remote_branches_data)
-                
-                remote_lines = remote_branches_data.strip().split('\n') if remote_branches_data.strip() else []
-                local_branch_names = {b[0] for b in all_branches if not b[1]}
-                
-                for line in remote_lines:
-                    branch_name = line.strip()
-                    if '->' in branch_name:
-                        continue
-                    
+                # local_info is keyed by local branch name, so it serves as the duplicate check
+                for branch_name in remote_info:
                     if '/' in branch_name:
                         parts = branch_name.split('/', 1)
                         remote_name = parts[0]
                         branch_short_name = parts[1]
                         
-                        if branch_short_name in local_branch_names:
+                        if branch_short_name in local_info:
                             continue
                         
-                        all_branches.append((branch_name, True, remote_name))
+                        remote_branches.append((branch_name, True, remote_name))
             
-            # Get basic branch info (cached)
-            # Use different cache keys for local vs remote branches
-            cache_key = f'branch_info:{"remote" if self.show_remotes else "local"}'
-            batch_info = None
-            if self.cache:
-                batch_info = self.cache.get(cache_key)
-            
-            if not batch_info:
-                batch_info = self._get_batch_branch_info(all_branches, worktree_branches)
-                if self.cache:
-                    self.cache.set(cache_key, batch_info)
+            batch_info = dict(local_info)
+            batch_info.update(remote_info)
+            all_branches = self._merge_by_commit_date(all_branches, remote_branches, batch_info)
             
             # Check uncommitted changes once for current branch
             has_uncommitted = False
             if self.current_branch:
-                if self.cache:
-                    cached_uncommitted = self.cache.get('uncommitted_changes')
-                    if cached_uncommitted is not None:
-                        has_uncommitted = cached_uncommitted
-                    else:
-                        has_uncommitted = self._check_uncommitted_changes_batch()
-                        self.cache.set('uncommitted_changes', has_uncommitted)
-                else:
-                    has_uncommitted = self._check_uncommitted_changes_batch()
+                has_uncommitted = uncommitted_future.result()
             
             # Build initial BranchInfo objects with basic data
+            now = int(time.time())
+            self._relative_dates_minute = now // 60
             for branch_name, is_remote, remote_name in all_branches:
                 if branch_name in batch_info:
                     info = batch_info[branch_name]
-                    
                     # Create branch with placeholder values for expensive data
                     branch_info = BranchInfo(
                         name=branch_name,
                         is_current=(branch_name == self.current_branch),
                         commit_hash=info['hash'],
-                        commit_date=datetime.fromtimestamp(info['timestamp']),
+                        commit_timestamp=info['timestamp'],
                         commit_message=info['message'],
                         commit_author=info['author'],
                         has_uncommitted_changes=(has_uncommitted if branch_name == self.current_branch else False),
@@ -1421,17 +2374,20 @@ class GitBranchManager:
                         is_merged=False,     # Will be enriched
                         in_worktree=(branch_name in worktree_branches) if worktree_branches else False,
                         commits_ahead=0,     # Will be enriched
-                        commits_behind=0     # Will be enriched
+                        commits_behind=0,    # Will be enriched
+                        relative_date=format_relative_age(now - info['timestamp']),
+                        date_color=age_color(now - info['timestamp'])
                     )
                     self.branches.append(branch_info)
             
-            # Sort branches by commit date
-            self.branches.sort(key=lambda b: b.commit_date, reverse=True)
+            self._row_cache.clear()  # Drop rows of branches that no longer exist
             
             # Apply filters and refresh display
             self._apply_filters()
             
             # Phase 2: Enrich data in background
+            self._counts_wanted.clear()
+            self._counts_pending.clear()
             for i, branch in enumerate(self.branches):
                 if not branch.is_remote and branch.name not in self.enrichment_in_progress:
                     self.enrichment_in_progress.add(branch.name)
@@ -1444,62 +2400,101 @@ class GitBranchManager:
             # If git commands fail, use the old method as fallback
             self.get_branches(stdscr)
     
+    def _get_enrichment_data(self) -> Tuple[set, str, set, Optional[Dict[str, Tuple[int, int]]]]:
+        """Get the data shared by all branch enrichment tasks.
+        
+        Computed under a lock so that concurrent enrichment tasks wait for
+        the first one and then hit the cache, instead of each spawning the
+        same git commands.
+        
+        Returns:
+            Tuple of (remote branch names, base branch, merged branch names,
+            batched commit counts or None if batching is unsupported)
+        """
+        with self._enrichment_lock:
+            base_branch = self.config.get('default_base_branch', 'main')
+            all_local_branches = {b.name for b in self.branches if not b.is_remote}
+            if base_branch not in all_local_branches:
+                if 'main' in all_local_branches:
+                    base_branch = 'main'
+                elif 'master' in all_local_branches:
+                    base_branch = 'master'
+            
+            # Remote branches set, merged branches set and commit counts for all
+            # branches at once, each cached; the missing ones are independent
+            # git commands, so they run concurrently
+            lookups = [
+                ('remote_branches_set', self._get_remote_branches_set),
+                (f'merged_branches:{base_branch}', lambda: self._get_merged_branches_set(base_branch)),
+                (f'commit_counts:{base_branch}', lambda: self._get_commit_counts_batch(base_branch)),
+            ]
+            values = [self.cache.get(key) if self.cache else None for key, _ in lookups]
+            missing = [i for i, value in enumerate(values) if value is None]
+            for i, value in zip(missing, self._run_in_parallel([lookups[i][1] for i in missing])):
+                values[i] = value
+                # Unsupported batch counts (None) aren't cached
+                if self.cache and value is not None:
+                    self.cache.set(lookups[i][0], value)
+            
+            remote_branches, merged_branches, batch_counts = values
+            return remote_branches, base_branch, merged_branches, batch_counts
+    
+    def _run_in_parallel(self, calls: List[Any]) -> List[Any]:
+        """Run independent git lookups concurrently.
+        
+        Each lookup spends its time waiting on its own git process, so the
+        total latency is that of the slowest one rather than the sum. A
+        separate short-lived pool is used because callers may already be
+        running on self.executor.
+        
+        Args:
+            calls: Functions taking no arguments
+            
+        Returns:
+            The results of the calls, in order
+        """
+        if len(calls) <= 1:
+            # Nothing to overlap, so skip the pool
+            return [call() for call in calls]
+        with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+            futures = [pool.submit(call) for call in calls]
+            return [future.result() for future in futures]
+    
     def _start_background_enrichment(self, stdscr=None):
         """Start background threads to enrich branch data."""
         
         def enrich_branch_data(index: int, branch: BranchInfo):
             """Enrich a single branch with expensive data."""
             try:
-                # Get remote branches set (cached)
-                remote_branches = None
-                if self.cache:
-                    remote_branches = self.cache.get('remote_branches_set')
-                
-                if remote_branches is None:
-                    remote_branches = self._get_remote_branches_set()
-                    if self.cache:
-                        self.cache.set('remote_branches_set', remote_branches)
-                
-                # Get merged branches set (cached)
-                base_branch = self.config.get('default_base_branch', 'main')
-                all_local_branches = {b.name for b in self.branches if not b.is_remote}
-                if base_branch not in all_local_branches:
-                    if 'main' in all_local_branches:
-                        base_branch = 'main'
-                    elif 'master' in all_local_branches:
-                        base_branch = 'master'
-                
-                merged_branches = None
-                if self.cache:
-                    merged_branches = self.cache.get(f'merged_branches:{base_branch}')
-                
-                if merged_branches is None:
-                    merged_branches = self._get_merged_branches_set(base_branch)
-                    if self.cache:
-                        self.cache.set(f'merged_branches:{base_branch}', merged_branches)
+                remote_branches, base_branch, merged_branches, batch_counts = self._get_enrichment_data()
                 
-                # Get commit counts (cached per branch)
+                # Get commit counts (batched when supported, otherwise cached per branch)
                 commits_ahead = 0
                 commits_behind = 0
-                if base_branch and branch.name != base_branch:
+                if base_branch and branch.name != base_branch and batch_counts is not None:
+                    commits_ahead, commits_behind = batch_counts.get(branch.name, (0, 0))
+                elif base_branch and branch.name != base_branch:
                     cache_key = f'commit_counts:{branch.name}:{base_branch}'
                     counts = None
                     if self.cache:
                         counts = self.cache.get(cache_key)
                     
-                    if counts is None:
+                    if counts is not None:
+                        commits_ahead, commits_behind = counts
+                    elif branch.name not in self._counts_wanted:
+                        # Off screen: defer the rev-list until the row is drawn
+                        self._counts_pending.add(branch.name)
+                    else:
                         commits_ahead, commits_behind = self._get_branch_commit_counts(branch.name, base_branch)
                         if self.cache:
                             self.cache.set(cache_key, (commits_ahead, commits_behind))
-                    else:
-                        commits_ahead, commits_behind = counts
                 
                 # Create updated branch info
                 updated_branch = BranchInfo(
                     name=branch.name,
                     is_current=branch.is_current,
                     commit_hash=branch.commit_hash,
-                    commit_date=branch.commit_date,
+                    commit_timestamp=branch.commit_timestamp,
                     commit_message=branch.commit_message,
                     commit_author=branch.commit_author,
                     has_uncommitted_changes=branch.has_uncommitted_changes,
@@ -1509,7 +2504,9 @@ class GitBranchManager:
                     is_merged=branch.name in merged_branches,
                     in_worktree=branch.in_worktree,
                     commits_ahead=commits_ahead,
-                    commits_behind=commits_behind
+                    commits_behind=commits_behind,
+                    relative_date=branch.relative_date,
+                    date_color=branch.date_color
                 )
                 
                 return index, updated_branch
@@ -1517,41 +2514,164 @@ class GitBranchManager:
             except Exception as e:
                 # Return original branch on error
                 return index, branch
-            finally:
-                self.enrichment_in_progress.discard(branch.name)
         
-        # Process enrichment queue in thread pool
-        futures = []
+        # Process enrichment queue in thread pool; results are handed to the
+        # main loop, which applies them with _apply_enrichment_results
         while not self.enrichment_queue.empty():
             try:
                 index, branch = self.enrichment_queue.get_nowait()
                 future = self.executor.submit(enrich_branch_data, index, branch)
-                futures.append(future)
+                future.add_done_callback(lambda done: self._enrichment_results.put(done.result()))
             except:
                 break
+    
+    def _apply_enrichment_results(self) -> None:
+        """Apply enriched branch data that background workers have finished.
+        
+        Called from the main loop, the only thread that replaces or patches
+        self.branches, so an update can't be written to a list that is being
+        swapped out by a checkout, create, rename or delete. Each result is
+        matched to its branch by name and only the enriched fields are
+        copied over.
+        """
+        applied = False
+        while not self._enrichment_results.empty():
+            index, updated_branch = self._enrichment_results.get_nowait()
+            # The list may have been patched in place since enrichment started,
+            # so locate the branch by name and copy over only the enriched fields
+            if index >= len(self.branches) or self.branches[index].name != updated_branch.name:
+                index = next((i for i, b in enumerate(self.branches) if b.name == updated_branch.name), -1)
+            if index >= 0:
+                self.branches[index] = self.branches[index]._replace(
+                    has_upstream=updated_branch.has_upstream,
+                    is_merged=updated_branch.is_merged,
+                    commits_ahead=updated_branch.commits_ahead,
+                    commits_behind=updated_branch.commits_behind
+                )
+                applied = True
+            
+            # Cleared only once the result is applied, so the main loop
+            # keeps polling until the final update is visible
+            self.enrichment_in_progress.discard(updated_branch.name)
+        if applied:
+            self._apply_filters()
+    
+    def _request_visible_counts(self, first: int, count: int) -> None:
+        """Enrich the commit counts of visible rows that were deferred.
         
-        # Update branches as results come in
-        def update_branches():
-            for future in as_completed(futures):
-                try:
-                    index, updated_branch = future.result()
-                    if index < len(self.branches):
-                        self.branches[index] = updated_branch
-                        self._apply_filters()
-                        
-                        # Refresh display if stdscr provided
-                        if stdscr:
-                            # This would need to be called from main thread
-                            # For now, we'll rely on the main loop to refresh
-                            pass
-                except Exception as e:
-                    pass
+        When git can't batch ahead/behind counts, enrichment only runs the
+        per-branch rev-list for rows that have been on screen. Called with
+        the visible window on each full redraw, so scrolling loads counts
+        for the rows that come into view.
+        
+        Args:
+            first: Index of the first visible row in the filtered list
+            count: Number of visible rows
+        """
+        names = {b.name for b in self.filtered_branches[first:first + count] if not b.is_remote}
+        self._counts_wanted.update(names)
+        deferred = names & self._counts_pending
+        if not deferred:
+            return
+        
+        for i, branch in enumerate(self.branches):
+            if branch.name in deferred and branch.name not in self.enrichment_in_progress:
+                self._counts_pending.discard(branch.name)
+                self.enrichment_in_progress.add(branch.name)
+                self.enrichment_queue.put((i, branch))
+        self._start_background_enrichment()
+    
+    @staticmethod
+    def _merge_by_commit_date(local_branches: List[Tuple[str, bool, Optional[str]]],
+                              remote_branches: List[Tuple[str, bool, Optional[str]]],
+                              batch_info: Dict[str, Dict]) -> List[Tuple[str, bool, Optional[str]]]:
+        """Merge local and remote branch entries into one commit date order.
+        
+        Both lists arrive newest commit first from _get_branch_refs, so a
+        linear merge replaces sorting the whole branch list. On equal
+        commit times local branches come before remote ones.
+        
+        Args:
+            local_branches: (name, is_remote, remote_name) entries for local branches
+            remote_branches: The same entries for remote branches
+            batch_info: Branch info by name, used for the commit timestamps
+            
+        Returns:
+            All entries, most recent commit first
+        """
+        if not remote_branches:
+            return local_branches
+        return list(heapq.merge(local_branches, remote_branches, key=lambda entry: -batch_info[entry[0]]['timestamp']))
+    
+    def _merge_remote_refs(self) -> None:
+        """Add remote branches listed in the background to the branch list.
+        
+        Called by the main loop once the listing started by
+        get_branches_progressive has finished. Remote branches that have a
+        local branch of the same name are skipped as in the full load, and
+        the rest are inserted in commit date order. The selection stays on
+        the branch it was on.
+        """
+        future, self._remote_refs_future = self._remote_refs_future, None
+        try:
+            current_branch, local_info, remote_info = future.result()
+        except Exception:
+            return
+        if not self.show_remotes:
+            return
+        
+        if self.cache:
+            self.cache.set('local_branches', (current_branch, local_info))
+            self.cache.set('branch_info:remote', remote_info)
+        
+        selected_name = None
+        if 0 <= self.selected_index < len(self.filtered_branches):
+            selected_name = self.filtered_branches[self.selected_index].name
+        
+        # Negated timestamps ascend, so bisect_right places each remote branch
+        # after local branches and earlier remotes with the same commit time
+        local_names = {b.name for b in self.branches if not b.is_remote}
+        keys = [-b.commit_timestamp for b in self.branches]
+        now = int(time.time())
+        for branch_name, info in remote_info.items():
+            if '/' not in branch_name:
+                continue
+            remote_name, branch_short_name = branch_name.split('/', 1)
+            if branch_short_name in local_names:
+                continue
+            
+            branch_info = BranchInfo(
+                name=branch_name,
+                is_current=False,
+                commit_hash=info['hash'],
+                commit_timestamp=info['timestamp'],
+                commit_message=info['message'],
+                commit_author=info['author'],
+                has_uncommitted_changes=False,
+                is_remote=True,
+                remote_name=remote_name,
+                has_upstream=True,
+                is_merged=False,
+                in_worktree=False,
+                commits_ahead=0,
+                commits_behind=0,
+                relative_date=format_relative_age(now - info['timestamp']),
+                date_color=age_color(now - info['timestamp'])
+            )
+            index = bisect_right(keys, -info['timestamp'])
+            keys.insert(index, -info['timestamp'])
+            self.branches.insert(index, branch_info)
         
-        # Run updates in a separate thread
-        threading.Thread(target=update_branches, daemon=True).start()
+        self._apply_filters()
+        if selected_name is not None:
+            self.selected_index = next(
+                (i for i, b in enumerate(self.filtered_branches) if b.name == selected_name),
+                self.selected_index
+            )
     
     def load_branches(self, stdscr=None) -> None:
         """Load branches using progressive loading if cache is enabled."""
+        self._remote_refs_future = None  # Drop remote refs still listing for an earlier load
         if self.cache:
             self.get_branches_progressive(stdscr)
         else:
@@ -1571,61 +2691,23 @@ class GitBranchManager:
         try:
             if stdscr:
                 self.show_loading_message(stdscr, "Loading branches...")
-            # First get the current branch
-            current_result = self._run_command(
-                ["git", "branch", "--show-current"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            self.current_branch = current_result.stdout.strip()
+            # The uncommitted changes check is independent of the ref queries below, so run it alongside them
+            uncommitted_future = self._start_uncommitted_check()
+            
+            # Get the current branch and all local (and remote) branch info in one call
+            self.current_branch, local_info, remote_info = self._get_branch_refs(include_remotes=self.show_remotes)
             
             self.branches = []
             
             # Collect all branch names first
-            all_branches = []
-            worktree_branches = set()
-            
-            # Get local branches
-            result = self._run_command(
-                ["git", "branch"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            lines = result.stdout.strip().split('\n') if result.stdout.strip() else []
-            
-            for line in lines:
-                branch_name = line.strip()
-                if branch_name.startswith('* '):
-                    branch_name = branch_name[2:]
-                elif branch_name.startswith('+ '):
-                    # Branch checked out in a worktree
-                    branch_name = branch_name[2:]
-                    worktree_branches.add(branch_name)
-                all_branches.append((branch_name, False, None))  # (name, is_remote, remote_name)
+            all_branches = [(name, False, None) for name in local_info]  # (name, is_remote, remote_name)
+            worktree_branches = {name for name, info in local_info.items() if info['in_worktree']}
             
             # Get remote branches if enabled
+            remote_branches = []
             if self.show_remotes:
-                remote_result = self._run_command(
-                    ["git", "branch", "-r"],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                
-                remote_lines = remote_result.stdout.strip().split('\n') if remote_result.stdout.strip() else []
-                
-                # First pass: collect local branch names for duplicate checking
-                local_branch_names = {b[0] for b in all_branches if not b[1]}
-                
-                for line in remote_lines:
-                    branch_name = line.strip()
-                    # Skip HEAD pointer
-                    if '->' in branch_name:
-                        continue
-                    
+                # local_info is keyed by local branch name, so it serves as the duplicate check
+                for branch_name in remote_info:
                     # Parse remote/branch format
                     if '/' in branch_name:
                         parts = branch_name.split('/', 1)
@@ -1633,23 +2715,20 @@ class GitBranchManager:
                         branch_short_name = parts[1]
                         
                         # Skip if this branch exists locally
-                        if branch_short_name in local_branch_names:
+                        if branch_short_name in local_info:
                             continue
                         
-                        all_branches.append((branch_name, True, remote_name))
+                        remote_branches.append((branch_name, True, remote_name))
             
-            # Get batch info for all branches
-            batch_info = self._get_batch_branch_info(all_branches, worktree_branches)
+            batch_info = dict(local_info)
+            batch_info.update(remote_info)
+            all_branches = self._merge_by_commit_date(all_branches, remote_branches, batch_info)
             
             # Check uncommitted changes once for current branch
             has_uncommitted = False
             if self.current_branch:
-                has_uncommitted = self._check_uncommitted_changes_batch()
-            
-            # Get set of branches that exist on remote
-            remote_branch_names = self._get_remote_branches_set()
+                has_uncommitted = uncommitted_future.result()
             
-            # Get set of branches that have been merged into main/master
             # Use the configured default base branch, falling back to main or master
             base_branch = self.config.get('default_base_branch', 'main')
             # If configured base doesn't exist, try to find main or master
@@ -1660,13 +2739,32 @@ class GitBranchManager:
                 elif 'master' in all_local_branches:
                     base_branch = 'master'
             
-            merged_branch_names = self._get_merged_branches_set(base_branch)
+            # The set of branches that exist on remote (reusing the remote names
+            # listed above), the set merged into main/master and the commit counts
+            # for all branches at once (if git supports it) are independent
+            remote_branch_names, merged_branch_names, batch_counts = self._run_in_parallel([
+                lambda: self._get_remote_branches_set(list(remote_info) if self.show_remotes else None),
+                lambda: self._get_merged_branches_set(base_branch),
+                lambda: self._get_commit_counts_batch(base_branch),
+            ])
+            if batch_counts is None:
+                # Older git needs one rev-list per branch, so run them concurrently
+                count_branches = [name for name, is_remote, _ in all_branches if not is_remote and name != base_branch]
+                batch_counts = {}
+                if len(count_branches) == 1:
+                    # Nothing to overlap, so skip the pool
+                    batch_counts[count_branches[0]] = self._get_branch_commit_counts(count_branches[0], base_branch)
+                elif count_branches:
+                    with ThreadPoolExecutor(max_workers=min(16, len(count_branches))) as executor:
+                        counts = executor.map(lambda name: self._get_branch_commit_counts(name, base_branch), count_branches)
+                        batch_counts = dict(zip(count_branches, counts))
             
             # Build BranchInfo objects
+            now = int(time.time())
+            self._relative_dates_minute = now // 60
             for branch_name, is_remote, remote_name in all_branches:
                 if branch_name in batch_info:
                     info = batch_info[branch_name]
-                    
                     # For local branches, check if they exist on remote
                     # For remote branches, they obviously have upstream
                     if is_remote:
@@ -1681,14 +2779,14 @@ class GitBranchManager:
                     # Get commit counts for local branches only (skip remote branches for performance)
                     commits_ahead = 0
                     commits_behind = 0
-                    if not is_remote and base_branch:
-                        commits_ahead, commits_behind = self._get_branch_commit_counts(branch_name, base_branch)
+                    if not is_remote:
+                        commits_ahead, commits_behind = batch_counts.get(branch_name, (0, 0))
                     
                     branch_info = BranchInfo(
                         name=branch_name,
                         is_current=(branch_name == self.current_branch),
                         commit_hash=info['hash'],
-                        commit_date=datetime.fromtimestamp(info['timestamp']),
+                        commit_timestamp=info['timestamp'],
                         commit_message=info['message'],
                         commit_author=info['author'],
                         has_uncommitted_changes=(has_uncommitted if branch_name == self.current_branch else False),
@@ -1698,12 +2796,13 @@ class GitBranchManager:
                         is_merged=is_merged,
                         in_worktree=(branch_name in worktree_branches) if worktree_branches else False,
                         commits_ahead=commits_ahead,
-                        commits_behind=commits_behind
+                        commits_behind=commits_behind,
+                        relative_date=format_relative_age(now - info['timestamp']),
+                        date_color=age_color(now - info['timestamp'])
                     )
                     self.branches.append(branch_info)
             
-            # Sort branches by commit date (most recent first)
-            self.branches.sort(key=lambda b: b.commit_date, reverse=True)
+            self._row_cache.clear()  # Drop rows of branches that no longer exist
             
             # Apply filters
             self._apply_filters()
@@ -1715,57 +2814,153 @@ class GitBranchManager:
     def _apply_filters(self) -> None:
         """Apply all active filters to the branch list.
         
-        Filters are applied in sequence:
-        1. Search filter (name substring match)
-        2. Author filter (current user's branches only)
-        3. Age filter (hide branches older than 3 months)
-        4. Prefix filter (branches starting with specified prefix)
-        5. Merged filter (hide branches merged into main/master)
+        Filters are combined in a single pass over the branch list, checked
+        cheapest first so most branches are rejected before the name search:
+        1. Prefix filter (branches starting with specified prefix)
+        2. Age filter (hide branches older than 3 months)
+        3. Merged filter (hide branches merged into main/master)
+        4. Author filter (current user's branches only)
+        5. Search filter (name substring match)
         
         Updates self.filtered_branches with the filtered results.
         """
-        self.filtered_branches = self.branches[:]
-        
-        # Search filter (name substring)
-        if self.search_filter:
+        search = self.search_filter.lower() if self.search_filter else ""
+        # Lowercased names are cached per branch name and filled in on first use
+        search_names = self._search_names
+        if search and len(search_names) > 2 * len(self.branches) + 64:
+            # Drop names of deleted and renamed branches
+            search_names.clear()
+        author = self.current_user if self.author_filter and self.current_user else None
+        # One clock read per call; rows compare against the integer commit time
+        cutoff = int(time.time()) - 90 * 86400 if self.age_filter else None
+        prefix = self.prefix_filter
+        hide_merged = self.merged_filter
+        
+        if not (search or author or cutoff is not None or prefix or hide_merged):
+            self.filtered_branches = self.branches[:]
+        else:
             self.filtered_branches = [
-                b for b in self.filtered_branches 
-                if self.search_filter.lower() in b.name.lower()
+                b for b in self.branches
+                if (not prefix or b.name.startswith(prefix))
+                and (cutoff is None or b.commit_timestamp >= cutoff)
+                and (not hide_merged or not b.is_merged or b.is_current)
+                and (not author or b.commit_author == author)
+                and (not search or search in (search_names.get(b.name) or search_names.setdefault(b.name, b.name.lower())))
             ]
         
-        # Author filter
-        if self.author_filter and self.current_user:
-            self.filtered_branches = [
-                b for b in self.filtered_branches 
-                if b.commit_author == self.current_user
-            ]
+        # Adjust selected index if it's out of bounds
+        if self.selected_index >= len(self.filtered_branches):
+            self.selected_index = max(0, len(self.filtered_branches) - 1)
+    
+    def _refresh_relative_dates(self, now: int) -> None:
+        """Re-format relative commit dates that have changed since they were formatted.
         
-        # Age filter (hide old branches > 3 months)
-        if self.age_filter:
-            three_months_ago = datetime.now() - timedelta(days=90)
-            self.filtered_branches = [
-                b for b in self.filtered_branches 
-                if b.commit_date >= three_months_ago
-            ]
+        Relative dates and their colors are set when branches load, so in a
+        long session they would drift ("5 minutes ago" an hour later). Called
+        at most once a minute; only branches whose date string or color changed
+        get a new BranchInfo, so the row cache is only rebuilt for those rows.
         
-        # Prefix filter
-        if self.prefix_filter:
-            self.filtered_branches = [
-                b for b in self.filtered_branches 
-                if b.name.startswith(self.prefix_filter)
-            ]
+        Args:
+            now: Current Unix time in seconds
+        """
+        self._relative_dates_minute = now // 60
+        changed = False
+        for i, branch in enumerate(self.branches):
+            relative_date = format_relative_age(now - branch.commit_timestamp)
+            date_color = age_color(now - branch.commit_timestamp)
+            if relative_date != branch.relative_date or date_color != branch.date_color:
+                self.branches[i] = branch._replace(relative_date=relative_date, date_color=date_color)
+                changed = True
+        if changed:
+            self._apply_filters()
+    
+    def _remove_branch_from_list(self, branch_name: str) -> None:
+        """Remove a deleted branch from the branch list without reloading.
         
-        # Merged filter (hide merged branches)
-        if self.merged_filter:
-            self.filtered_branches = [
-                b for b in self.filtered_branches 
-                if not b.is_merged or b.is_current
-            ]
+        Args:
+            branch_name: Name of the branch that was deleted
+        """
+        self.branches = [b for b in self.branches if b.name != branch_name]
+        self._apply_filters()
+    
+    def _mark_current_branch(self, branch_name: str, has_uncommitted_changes: bool) -> None:
+        """Update current branch flags in place after a checkout without reloading.
         
-        # Adjust selected index if it's out of bounds
-        if self.selected_index >= len(self.filtered_branches):
-            self.selected_index = max(0, len(self.filtered_branches) - 1)
+        Only the previously current branch and the newly checked out branch
+        change, so their entries are patched instead of re-running git.
+        
+        Args:
+            branch_name: Name of the branch that is now checked out
+            has_uncommitted_changes: Whether the working tree is dirty after checkout
+        """
+        self.current_branch = branch_name
+        self.branches = [
+            b._replace(
+                is_current=(b.name == branch_name),
+                has_uncommitted_changes=(has_uncommitted_changes and b.name == branch_name)
+            ) if b.is_current or b.name == branch_name else b
+            for b in self.branches
+        ]
+        self._apply_filters()
+    
+    def _add_branch_to_list(self, branch_name: str, checked_out: bool) -> bool:
+        """Add a branch just created at HEAD to the branch list without reloading.
+        
+        The new branch points at the current branch's commit, so its commit
+        info, merge status and ahead/behind counts are copied from it.
+        Remote-only rows with the same branch name are dropped, as a full
+        load lists only the local branch.
+        
+        Args:
+            branch_name: Name of the newly created branch
+            checked_out: Whether the new branch was also checked out
             
+        Returns:
+            True if the list was updated, False if there is no current branch
+            entry to copy from and the list needs a full reload
+        """
+        current = next((b for b in self.branches if b.is_current), None)
+        if current is None:
+            return False
+        
+        new_branch = current._replace(
+            name=branch_name,
+            is_current=False,
+            has_uncommitted_changes=False,
+            has_upstream=branch_name in self._get_remote_branches_set(),
+            in_worktree=False
+        )
+        if self.show_remotes:
+            self.branches = [
+                b for b in self.branches
+                if not (b.is_remote and b.name.split('/', 1)[-1] == branch_name)
+            ]
+        # Keep the list ordered by commit date; ties go after the current branch
+        index = self.branches.index(current) + 1
+        self.branches.insert(index, new_branch)
+        
+        if checked_out:
+            self._mark_current_branch(branch_name, current.has_uncommitted_changes)
+        else:
+            self._apply_filters()
+        return True
+    
+    def _rename_branch_in_list(self, old_name: str, new_name: str) -> None:
+        """Rename a branch in the branch list without reloading.
+        
+        Args:
+            old_name: Previous name of the branch
+            new_name: New name of the branch
+        """
+        has_upstream = new_name in self._get_remote_branches_set()
+        self.branches = [
+            b._replace(name=new_name, has_upstream=has_upstream) if b.name == old_name and not b.is_remote else b
+            for b in self.branches
+        ]
+        if self.current_branch == old_name:
+            self.current_branch = new_name
+        self._apply_filters()
+    
     def stash_changes(self) -> bool:
         """Stash current changes if any exist.
         
@@ -1777,15 +2972,8 @@ class GitBranchManager:
             to stash or if stashing failed
         """
         try:
-            # Check if there are any changes to stash
-            status_result = self._run_command(
-                ["git", "status", "--porcelain"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            if status_result.stdout.strip():
+            # Check if there are any changes to stash (cached by the caller's check)
+            if self._has_uncommitted_changes():
                 # There are changes, stash them
                 stash_result = self._run_command(
                     ["git", "stash", "push", "-m", "Stashed by git-branch-manager"],
@@ -1804,6 +2992,8 @@ class GitBranchManager:
                     )
                     if stash_list.stdout:
                         self.last_stash_ref = stash_list.stdout.split(':')[0]
+                if self.cache:
+                    self.cache.invalidate('uncommitted_changes')
                 return True
             return False
             
@@ -1817,6 +3007,12 @@ class GitBranchManager:
         For remote branches, creates a local tracking branch if it doesn't
         already exist. For local branches, performs a standard checkout.
         
+        Remote rows are only listed when no local branch has the same name,
+        so creating the branch is tried first, in a single git checkout.
+        Only if that fails because the local branch exists by now is it
+        checked out instead; it is never reset to the remote, so local
+        commits on it are kept.
+        
         Args:
             branch: Name of the branch to checkout
             is_remote: Whether this is a remote branch (e.g., origin/feature)
@@ -1830,40 +3026,34 @@ class GitBranchManager:
                 parts = branch.split('/', 1)
                 local_branch_name = parts[1]
                 
-                # Check if local branch already exists
-                check_result = self._run_command(
-                    ["git", "rev-parse", "--verify", local_branch_name],
-                    capture_output=True,
-                    check=False
-                )
-                
-                if check_result.returncode == 0:
-                    # Local branch exists, just check it out
+                try:
+                    # Create new tracking branch
                     self._run_command(
-                        ["git", "checkout", local_branch_name],
-                        capture_output=True,
-                        text=True,
+                        ["git", "checkout", "--track", "-b", local_branch_name, branch],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
                         check=True
                     )
-                else:
-                    # Create new tracking branch
+                except subprocess.CalledProcessError:
+                    if not self._ref_exists(f"refs/heads/{local_branch_name}"):
+                        raise
+                    # Local branch exists, just check it out
                     self._run_command(
-                        ["git", "checkout", "-b", local_branch_name, branch],
-                        capture_output=True,
-                        text=True,
+                        ["git", "checkout", local_branch_name],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
                         check=True
                     )
             else:
                 self._run_command(
                     ["git", "checkout", branch],
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     check=True
                 )
             
             # Invalidate cache after checkout
             if self.cache:
-                self.cache.invalidate('current_branch')
                 self.cache.invalidate('uncommitted_changes')
                 self.cache.invalidate('local_branches')
             
@@ -1887,8 +3077,8 @@ class GitBranchManager:
         try:
             self._run_command(
                 ["git", "branch", "-d", branch],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True
             )
             
@@ -1905,8 +3095,8 @@ class GitBranchManager:
             try:
                 self._run_command(
                     ["git", "branch", "-D", branch],
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     check=True
                 )
                 
@@ -1937,8 +3127,8 @@ class GitBranchManager:
         try:
             self._run_command(
                 ["git", "branch", "-m", old_name, new_name],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True
             )
             
@@ -1947,8 +3137,6 @@ class GitBranchManager:
                 self.cache.invalidate('local_branches')
                 self.cache.invalidate_pattern('branch_info')
                 self.cache.invalidate_pattern('commit_counts')
-                if old_name == self.current_branch:
-                    self.cache.invalidate('current_branch')
             
             return True
         except subprocess.CalledProcessError:
@@ -1983,21 +3171,20 @@ class GitBranchManager:
         # Enable cursor
         curses.curs_set(1)
         
+        # The border and prompt are drawn once above; each keystroke only
+        # rewrites the input field, padded to blank out deleted characters
+        field_width = input_width - 1
+        
         while True:
             # Display current input
-            dialog.move(input_y, input_x)
-            dialog.clrtoeol()
-            dialog.addstr(input_y, input_x, user_input[:input_width - 1])
+            dialog.addnstr(input_y, input_x, user_input[:field_width].ljust(field_width), field_width)
             
             # Position cursor
-            if cursor_pos < input_width - 1:
+            if cursor_pos < field_width:
                 dialog.move(input_y, input_x + cursor_pos)
             
-            # Draw border again (clrtoeol might have erased it)
-            dialog.box()
-            dialog.addstr(2, 2, prompt[:dialog_width - 4])
-            
-            dialog.refresh()
+            dialog.noutrefresh()
+            curses.doupdate()
             
             # Get key
             key = dialog.getch()
@@ -2022,7 +3209,7 @@ class GitBranchManager:
                 cursor_pos = 0
             elif key == curses.KEY_END:
                 cursor_pos = len(user_input)
-            elif 32 <= key <= 126:  # Printable characters
+            elif key in _PRINTABLE_KEYS:
                 user_input = user_input[:cursor_pos] + chr(key) + user_input[cursor_pos:]
                 cursor_pos += 1
     
@@ -2037,72 +3224,12 @@ class GitBranchManager:
         """
         height, width = stdscr.getmaxyx()
         
-        help_text = [
-            ("Git Branch Manager - Help", curses.A_BOLD),
-            ("=" * 30, 0),
-            ("", 0),
-            ("Navigation:", curses.A_BOLD),
-            ("  ↑/↓        Navigate through branches", 0),
-            ("  PgUp/PgDn  Navigate by page", 0),
-            ("  Home/End   Jump to first/last branch", 0),
-            ("  q          Quit", 0),
-            ("  ESC        Clear filters (or quit if no filters)", 0),
-            ("  ?          Show this help", 0),
-            ("", 0),
-            ("Branch Operations:", curses.A_BOLD),
-            ("  Enter      Checkout selected branch", 0),
-            ("  D          Delete selected branch", 0),
-            ("  M          Rename/move selected branch", 0),
-            ("  N          Create new branch from current", 0),
-            ("", 0),
-            ("Stash Management:", curses.A_BOLD),
-            ("  S          Pop last stash (if available)", 0),
-            ("  Auto-detect Branch stashes detected when switching branches", 0),
-            ("", 0),
-            ("View Options:", curses.A_BOLD),
-            ("  r          Reload branch list", 0),
-            ("  t          Toggle remote branches (auto-fetches)", 0),
-            ("  f          Fetch latest from remote", 0),
-            ("  b          Open branch in browser", 0),
-            ("  B          Open branch comparison/PR in browser", 0),
-            ("", 0),
-            ("Filtering:", curses.A_BOLD),
-            ("  /          Search branches by name", 0),
-            ("  a          Toggle author filter (show only your branches)", 0),
-            ("  o          Toggle old branches filter (hide >3 months)", 0),
-            ("  m          Toggle merged filter (hide merged branches)", 0),
-            ("  p          Filter by prefix (feature/, bugfix/, etc)", 0),
-            ("  c          Clear all filters", 0),
-            ("", 0),
-            ("Status Indicators:", curses.A_BOLD),
-            ("  *          Current branch", 0),
-            ("  ↓          Remote branch", 0),
-            ("  [modified] Uncommitted changes", 0),
-            ("  [unpushed] Local branch not on remote", 0),
-            ("  [merged]   Branch merged into main/master", 0),
-            ("  [worktree] Branch checked out in worktree", 0),
-            ("  [+N]       N commits ahead of main/master", 0),
-            ("  [-N]       N commits behind main/master", 0),
-            ("  [+N/-M]    N ahead and M behind main/master", 0),
-            ("  ↻          Branch metadata still loading", 0),
-            ("", 0),
-            ("Color Coding:", curses.A_BOLD),
-            ("  Green      Current branch, [+N] ahead only", 0),
-            ("  Cyan       Branch names", 0),
-            ("  Yellow     Modified indicator, [-N] behind only", 0),
-            ("  Magenta    Recent commits (<1 week), [+N/-M] mixed", 0),
-            ("  Blue       Commit hashes", 0),
-            ("  Red        Old branches (>1 month)", 0),
-            ("", 0),
-            ("↑/↓ to scroll, any other key to return...", curses.A_BOLD),
-        ]
-        
         # Scrolling support
         scroll_offset = 0
-        max_scroll = max(0, len(help_text) - (height - 2))
+        max_scroll = max(0, len(_HELP_LINES) - (height - 2))
         
         while True:
-            stdscr.clear()
+            stdscr.erase()
             
             # Display help text with scrolling
             visible_lines = height - 2  # Leave room for borders
@@ -2110,17 +3237,13 @@ class GitBranchManager:
             
             for i in range(visible_lines):
                 line_idx = i + scroll_offset
-                if line_idx < len(help_text):
-                    text, attr = help_text[line_idx]
+                if line_idx < len(_HELP_LINES):
+                    text, attr = _HELP_LINES[line_idx]
                     y_pos = i + 1
                     
                     if y_pos < height - 1:
                         try:
-                            if attr:
-                                stdscr.attron(attr)
-                            stdscr.addstr(y_pos, start_x, text[:width - start_x - 1])
-                            if attr:
-                                stdscr.attroff(attr)
+                            stdscr.addnstr(y_pos, start_x, text, width - start_x - 1, attr)
                         except curses.error:
                             pass
             
@@ -2133,7 +3256,8 @@ class GitBranchManager:
                 except curses.error:
                     pass
             
-            stdscr.refresh()
+            stdscr.noutrefresh()
+            curses.doupdate()
             
             # Handle key input
             key = stdscr.getch()
@@ -2233,7 +3357,7 @@ class GitBranchManager:
         max_scroll = max(0, len(help_lines) - (height - 2))
         
         while True:
-            stdscr.clear()
+            stdscr.erase()
             
             # Display help with scrolling
             footer_height = 2  # Account for footer
@@ -2246,16 +3370,11 @@ class GitBranchManager:
                     
                     if y_pos < height - 1:
                         try:
-                            if line_idx == 0:  # Title
-                                stdscr.attron(curses.A_BOLD)
-                                stdscr.addstr(y_pos, 2, line[:width - 4])
-                                stdscr.attroff(curses.A_BOLD)
-                            elif line.startswith("Supported platforms") or (line.endswith(":") and not line.startswith(" ")):
-                                stdscr.attron(curses.A_BOLD)
-                                stdscr.addstr(y_pos, 2, line[:width - 4])
-                                stdscr.attroff(curses.A_BOLD)
+                            if line_idx == 0 or line.startswith("Supported platforms") or (line.endswith(":") and not line.startswith(" ")):
+                                # Title and section headings
+                                stdscr.addnstr(y_pos, 2, line, width - 4, curses.A_BOLD)
                             else:
-                                stdscr.addstr(y_pos, 2, line[:width - 4])
+                                stdscr.addnstr(y_pos, 2, line, width - 4)
                         except curses.error:
                             pass
             
@@ -2268,7 +3387,8 @@ class GitBranchManager:
                 except curses.error:
                     pass
             
-            stdscr.refresh()
+            stdscr.noutrefresh()
+            curses.doupdate()
             
             # Handle key input
             key = stdscr.getch()
@@ -2318,27 +3438,581 @@ class GitBranchManager:
             dialog.addstr(2 + i, 2, line[:dialog_width - 4])
         
         # Options
-        options = ["[Y]es", "[N]o", "[C]ancel"]
         option_y = dialog_height - 2
-        total_width = sum(len(opt) for opt in options) + 6
-        start_opt_x = (dialog_width - total_width) // 2
-        
-        x = start_opt_x
-        for opt in options:
-            dialog.addstr(option_y, x, opt)
-            x += len(opt) + 3
-        
-        dialog.refresh()
+        start_opt_x = (dialog_width - len(_CONFIRM_OPTIONS_LINE)) // 2
+        dialog.addstr(option_y, start_opt_x, _CONFIRM_OPTIONS_LINE)
+        
+        dialog.noutrefresh()
+        curses.doupdate()
+        
+        # Decode escape sequences so arrow keys aren't read as a bare ESC (cancel)
+        dialog.keypad(True)
+        responses = {
+            ord('y'): 'yes', ord('Y'): 'yes',
+            ord('n'): 'no', ord('N'): 'no',
+            ord('c'): 'cancel', ord('C'): 'cancel', 27: 'cancel',  # 27 is ESC
+        }
         
         # Wait for user input
         while True:
-            key = dialog.getch()
-            if key in [ord('y'), ord('Y')]:
-                return 'yes'
-            elif key in [ord('n'), ord('N')]:
-                return 'no'
-            elif key in [ord('c'), ord('C'), 27]:  # 27 is ESC
-                return 'cancel'
+            response = responses.get(dialog.getch())
+            if response:
+                return response
+    
+    def _on_toggle_remotes(self, stdscr) -> None:
+        """Toggle remote branches, fetching first when turning them on.
+        
+        Args:
+            stdscr: Curses screen object
+        """
+        # Fetch from remote before toggling
+        if not self.show_remotes:  # Only fetch when turning remotes ON
+            try:
+                # Use animated spinner for fetch
+                self._run_command_with_spinner(
+                    stdscr,
+                    ["git", "fetch", "--all"],
+                    "Fetching from remote...",
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=True
+                )
+                
+                # Invalidate remote-related caches after fetch
+                if self.cache:
+                    self.cache.invalidate('remote_branches')
+                    self.cache.invalidate('remote_branches_set')
+                    self.cache.invalidate_pattern('merged_branches')
+                    self.cache.invalidate_pattern('branch_info')  # Force re-fetch of branch info
+            
+            except subprocess.CalledProcessError as e:
+                self._show_message(stdscr, [
+                    f"Fetch failed: {e}",
+                    "Press any key to continue..."
+                ])
+                return
+        
+        self.show_remotes = not self.show_remotes
+        # Reload branches using progressive loading
+        self.load_branches(stdscr)
+        
+        # Adjust selected index if needed
+        if self.selected_index >= len(self.filtered_branches):
+            self.selected_index = max(0, len(self.filtered_branches) - 1)
+    
+    def _on_fetch(self, stdscr) -> None:
+        """Start a background fetch from all remotes unless one is running.
+        
+        Args:
+            stdscr: Curses screen object
+        """
+        # Fetch in the background; the list stays usable and is
+        # reloaded by the main loop once the fetch finishes
+        if self._fetch_future is None:
+            self._start_fetch()
+    
+    def _on_reload(self, stdscr) -> None:
+        """Reload the branch list with all cached git data dropped.
+        
+        Args:
+            stdscr: Curses screen object
+        """
+        # Clear cache to force fresh data
+        if self.cache:
+            self.cache.invalidate()  # Clear all cache entries
+        # Reload branches using progressive loading
+        self.load_branches(stdscr)
+        
+        # Adjust selected index if needed
+        if self.selected_index >= len(self.filtered_branches):
+            self.selected_index = max(0, len(self.filtered_branches) - 1)
+    
+    def _on_search(self, stdscr) -> None:
+        """Prompt for a search term and filter branches by name.
+        
+        Args:
+            stdscr: Curses screen object
+        """
+        search_term = self.show_input_dialog(
+            stdscr,
+            "Search branches by name:",
+            self.search_filter
+        )
+        if search_term is not None:  # User didn't cancel
+            self.search_filter = search_term
+            self._apply_filters()
+            self.selected_index = 0  # Reset to first result
+    
+    def _on_toggle_author_filter(self, stdscr) -> None:
+        """Toggle showing only branches whose last commit is by the current user.
+        
+        Args:
+            stdscr: Curses screen object
+        """
+        self.author_filter = not self.author_filter
+        self._apply_filters()
+        if self.selected_index >= len(self.filtered_branches):
+            self.selected_index = max(0, len(self.filtered_branches) - 1)
+    
+    def _on_toggle_age_filter(self, stdscr) -> None:
+        """Toggle hiding branches older than 3 months.
+        
+        Args:
+            stdscr: Curses screen object
+        """
+        self.age_filter = not self.age_filter
+        self._apply_filters()
+        if self.selected_index >= len(self.filtered_branches):
+            self.selected_index = max(0, len(self.filtered_branches) - 1)
+    
+    def _on_toggle_merged_filter(self, stdscr) -> None:
+        """Toggle hiding branches merged into the base branch.
+        
+        Args:
+            stdscr: Curses screen object
+        """
+        self.merged_filter = not self.merged_filter
+        self._apply_filters()
+        if self.selected_index >= len(self.filtered_branches):
+            self.selected_index = max(0, len(self.filtered_branches) - 1)
+    
+    def _on_prefix_filter(self, stdscr) -> None:
+        """Prompt for a prefix and filter branches by it.
+        
+        Args:
+            stdscr: Curses screen object
+        """
+        prefix = self.show_input_dialog(
+            stdscr,
+            "Filter by prefix (e.g. feature/, bugfix/):",
+            self.prefix_filter
+        )
+        if prefix is not None:  # User didn't cancel
+            self.prefix_filter = prefix
+            self._apply_filters()
+            self.selected_index = 0  # Reset to first result
+    
+    def _on_clear_filters(self, stdscr) -> None:
+        """Clear all active filters.
+        
+        Args:
+            stdscr: Curses screen object
+        """
+        self.clear_all_filters()
+    
+    def _on_pop_stash(self, stdscr) -> None:
+        """Pop the last stash created by the app.
+        
+        Args:
+            stdscr: Curses screen object
+        """
+        if self.last_stash_ref:
+            stdscr.erase()
+            stdscr.addnstr(0, 0, f"Popping stash {self.last_stash_ref}...", stdscr.getmaxyx()[1] - 1)
+            stdscr.refresh()
+            
+            try:
+                self._run_command(
+                    ["git", "stash", "pop", self.last_stash_ref],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=True
+                )
+                self.last_stash_ref = None  # Clear the reference
+                # Popped changes are now uncommitted on the current branch
+                if self.cache:
+                    self.cache.invalidate('uncommitted_changes')
+                self._mark_current_branch(self.current_branch, True)
+            except subprocess.CalledProcessError as e:
+                self._show_message(stdscr, [
+                    f"Failed to pop stash: {e}",
+                    "Press any key to continue..."
+                ])
+        else:
+            self._show_message(stdscr, [
+                "No stash to pop.",
+                "Press any key to continue..."
+            ])
+    
+    def _on_create_branch(self, stdscr) -> None:
+        """Prompt for a name and create a branch from the current one.
+        
+        Args:
+            stdscr: Curses screen object
+        """
+        # Get new branch name from user
+        new_branch_name = self.show_input_dialog(
+            stdscr,
+            "Enter new branch name:"
+        )
+        
+        if new_branch_name:
+            # Check if branch already exists
+            existing_names = [b.name for b in self.branches]
+            if new_branch_name in existing_names:
+                self._show_message(stdscr, [
+                    f"Branch '{new_branch_name}' already exists!",
+                    "Press any key to continue..."
+                ])
+                return
+            
+            # Ask if user wants to checkout the new branch
+            response = self.show_confirmation_dialog(
+                stdscr,
+                f"Create branch '{new_branch_name}'?\nAlso checkout the new branch?"
+            )
+            
+            if response == 'yes':
+                # Create and checkout
+                try:
+                    self._run_command(
+                        ["git", "checkout", "-b", new_branch_name],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        check=True
+                    )
+                    if self.cache:
+                        self.cache.invalidate('local_branches')
+                    if not self._add_branch_to_list(new_branch_name, checked_out=True):
+                        self.load_branches(stdscr)  # Refresh branch list
+                except subprocess.CalledProcessError as e:
+                    self._show_message(stdscr, [
+                        f"Failed to create branch: {e}",
+                        "Press any key to continue..."
+                    ])
+            elif response == 'no':
+                # Create without checkout
+                try:
+                    self._run_command(
+                        ["git", "branch", new_branch_name],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        check=True
+                    )
+                    if self.cache:
+                        self.cache.invalidate('local_branches')
+                    if not self._add_branch_to_list(new_branch_name, checked_out=False):
+                        self.load_branches(stdscr)  # Refresh branch list
+                except subprocess.CalledProcessError as e:
+                    self._show_message(stdscr, [
+                        f"Failed to create branch: {e}",
+                        "Press any key to continue..."
+                    ])
+    
+    def _on_delete_branch(self, stdscr) -> None:
+        """Delete the selected branch after confirmation.
+        
+        Args:
+            stdscr: Curses screen object
+        """
+        if not self.filtered_branches:
+            return
+        selected_branch_info = self.filtered_branches[self.selected_index]
+        selected_branch = selected_branch_info.name
+        
+        # Check if trying to delete a remote branch
+        if selected_branch_info.is_remote:
+            self._show_message(stdscr, [
+                "Cannot delete remote branches!",
+                "Remote branches must be deleted from the remote repository.",
+                "To delete a local copy of a remote branch, switch off remote view (press 't').",
+                "Press any key to continue..."
+            ])
+            return
+        
+        # Check if trying to delete current branch
+        if selected_branch == self.current_branch:
+            self._show_message(stdscr, [
+                "Cannot delete the current branch!",
+                "Please switch to another branch first.",
+                "Press any key to continue..."
+            ])
+            return
+        
+        # Check if trying to delete protected branch
+        if selected_branch in self.protected_branches:
+            response = self.show_confirmation_dialog(
+                stdscr,
+                f"WARNING: '{selected_branch}' is a protected branch!\nAre you REALLY sure you want to delete it?"
+            )
+            if response != 'yes':
+                return
+        
+        # Show confirmation dialog
+        response = self.show_confirmation_dialog(
+            stdscr,
+            f"Delete branch '{selected_branch}'?\nThis action cannot be undone."
+        )
+        
+        if response == 'yes':
+            if self.delete_branch(selected_branch):
+                if self.show_remotes:
+                    # A remote copy of the branch may now need to be listed
+                    self.load_branches(stdscr)
+                else:
+                    self._remove_branch_from_list(selected_branch)
+                # Adjust selected index if needed
+                if self.selected_index >= len(self.filtered_branches):
+                    self.selected_index = max(0, len(self.filtered_branches) - 1)
+            else:
+                self._show_message(stdscr, [
+                    f"Failed to delete branch '{selected_branch}'!",
+                    "The branch may have unpushed commits or is not fully merged.",
+                    "Press any key to continue..."
+                ])
+    
+    def _on_rename_branch(self, stdscr) -> None:
+        """Prompt for a new name and rename the selected branch.
+        
+        Args:
+            stdscr: Curses screen object
+        """
+        if not self.filtered_branches:
+            return
+        selected_branch = self.filtered_branches[self.selected_index].name
+        
+        # Get new name from user
+        new_name = self.show_input_dialog(
+            stdscr,
+            f"Rename branch '{selected_branch}' to:",
+            selected_branch
+        )
+        
+        if new_name and new_name != selected_branch:
+            # Check if new name already exists
+            existing_names = [b.name for b in self.branches]
+            if new_name in existing_names:
+                self._show_message(stdscr, [
+                    f"Branch '{new_name}' already exists!",
+                    "Press any key to continue..."
+                ])
+                return
+            
+            if self.move_branch(selected_branch, new_name):
+                if selected_branch in (self.config.get('default_base_branch', 'main'), 'main', 'master'):
+                    # Renaming the base branch changes merge status and counts for every branch
+                    self.load_branches(stdscr)
+                elif self.show_remotes:
+                    # The remote copy hidden behind the old name may now need to be
+                    # listed, and one matching the new name hidden
+                    self.load_branches(stdscr)
+                else:
+                    self._rename_branch_in_list(selected_branch, new_name)
+            else:
+                self._show_message(stdscr, [
+                    "Failed to rename branch!",
+                    "Press any key to continue..."
+                ])
+    
+    def _on_open_compare_in_browser(self, stdscr) -> None:
+        """Open the comparison/PR view for the selected branch in the browser.
+        
+        Args:
+            stdscr: Curses screen object
+        """
+        self._open_selected_in_browser(stdscr, 'compare')
+    
+    def _on_open_branch_in_browser(self, stdscr) -> None:
+        """Open the selected branch in the browser.
+        
+        Args:
+            stdscr: Curses screen object
+        """
+        self._open_selected_in_browser(stdscr, 'branch')
+    
+    def _open_selected_in_browser(self, stdscr, url_kind: str) -> None:
+        """Open a platform URL for the selected branch in the browser.
+        
+        Shared by the branch and compare keys: checks that a remote URL is
+        configured and the branch has been pushed, warns about merged
+        branches if configured to, then launches the browser command.
+        
+        Args:
+            stdscr: Curses screen object
+            url_kind: 'branch' for the branch view or 'compare' for the
+                comparison/PR view
+        """
+        if not self.filtered_branches or not self.url_builder:
+            if not self.url_builder:
+                key = self._show_message(stdscr, [
+                    "No remote repository URL found!",
+                    "Make sure you have a remote named 'origin' configured.",
+                    "",
+                    "Press 'h' for configuration help, any other key to continue..."
+                ])
+                if key == ord('h') or key == ord('H'):
+                    self.show_platform_config_help(stdscr)
+            return
+        
+        selected_branch_info = self.filtered_branches[self.selected_index]
+        selected_branch = selected_branch_info.name
+        
+        # Check if branch has been pushed
+        if not selected_branch_info.is_remote and not selected_branch_info.has_upstream:
+            self._show_message(stdscr, [
+                f"Branch '{selected_branch}' has not been pushed to remote!",
+                "Push the branch first before opening in browser.",
+                "",
+                "Press any key to continue..."
+            ])
+            return
+        
+        # Check if branch is merged and config prevents opening
+        if selected_branch_info.is_merged and self.config.get('prevent_browser_for_merged', False):
+            key = self._show_message(stdscr, [
+                f"Branch '{selected_branch}' has been merged!",
+                "",
+                "This branch has likely been deleted from the remote repository",
+                "after being merged (based on your configuration).",
+                "",
+                "Press 'o' to open anyway, or any other key to cancel...",
+                "",
+                "To disable this warning, set 'prevent_browser_for_merged' to false",
+                "in your ~/.config/git-branch-manager/config.json file."
+            ])
+            if key != ord('o') and key != ord('O'):
+                return
+            # If 'o' pressed, fall through to open the browser
+        
+        # For remote branches, strip the remote prefix (e.g., origin/)
+        if selected_branch_info.is_remote and '/' in selected_branch:
+            branch_name = selected_branch.split('/', 1)[1]
+        else:
+            branch_name = selected_branch
+        
+        if url_kind == 'compare':
+            url = self.url_builder.build_compare_url(branch_name)
+        else:
+            url = self.url_builder.build_branch_url(branch_name)
+        if url:
+            try:
+                # Use the configured browser command
+                browser_cmd = self.config.get('browser_command', 'open')
+                # Launcher output would be drawn over the curses screen, so discard it
+                self._run_command(
+                    [browser_cmd, url],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=True
+                )
+            except subprocess.CalledProcessError:
+                self._show_message(stdscr, [
+                    f"Failed to open browser!",
+                    f"URL: {url}",
+                    "Press any key to continue..."
+                ])
+        else:
+            key = self._show_message(stdscr, [
+                f"Platform '{self.url_builder.platform}' not supported for {url_kind} URLs",
+                "",
+                "Press 'h' for configuration help, any other key to continue..."
+            ])
+            if key == ord('h') or key == ord('H'):
+                self.show_platform_config_help(stdscr)
+    
+    def _on_checkout(self, stdscr) -> None:
+        """Check out the selected branch, offering to stash changes first.
+        
+        Args:
+            stdscr: Curses screen object
+        """
+        if not self.filtered_branches:
+            return
+        selected_branch_info = self.filtered_branches[self.selected_index]
+        selected_branch = selected_branch_info.name
+        
+        # For remote branches, show the local name that will be created
+        display_name = selected_branch
+        if selected_branch_info.is_remote and '/' in selected_branch:
+            display_name = selected_branch.split('/', 1)[1]
+        
+        if selected_branch != self.current_branch:
+            # Check if branch is checked out in a worktree
+            if selected_branch_info.in_worktree:
+                self._show_message(stdscr, [
+                    f"Cannot checkout branch '{selected_branch}'!",
+                    "This branch is already checked out in another worktree.",
+                    "",
+                    "Press any key to continue..."
+                ])
+                return
+            
+            # Check if there are changes to stash, refreshing the cached status
+            try:
+                has_changes = self._has_uncommitted_changes(refresh=True)
+                stashed = False
+                
+                if has_changes:
+                    # Show confirmation dialog
+                    response = self.show_confirmation_dialog(
+                        stdscr,
+                        f"You have uncommitted changes.\nStash them before switching to '{display_name}'?"
+                    )
+                    
+                    if response == 'cancel':
+                        return  # Go back to branch list
+                    elif response == 'yes':
+                        stashed = self.stash_changes()
+                        if not stashed:
+                            self._show_message(stdscr, [
+                                "Failed to stash changes!",
+                                "Press any key to continue..."
+                            ])
+                            return
+                    # If 'no', proceed without stashing
+                
+                # Checkout branch
+                if self.checkout_branch(selected_branch, selected_branch_info.is_remote):
+                    if selected_branch_info.is_remote:
+                        self.load_branches(stdscr)  # A local tracking branch was created
+                    else:
+                        self._mark_current_branch(selected_branch, has_changes and not stashed)
+                    
+                    # Check if the newly checked out branch has any stashes
+                    branch_stashes = self._get_branch_stashes(self.current_branch)
+                    if branch_stashes:
+                        # Show the most recent stash for this branch
+                        most_recent_stash = branch_stashes[0]
+                        stash_ref, stash_message = most_recent_stash
+                        
+                        key = self._show_message(stdscr, [
+                            f"Found {len(branch_stashes)} git-branch-manager stash{'es' if len(branch_stashes) > 1 else ''} for branch '{self.current_branch}':",
+                            "",
+                            f"Most recent: {stash_message}",
+                            "",
+                            "Apply this stash? (y/n)"
+                        ])
+                        if key in [ord('y'), ord('Y')]:
+                            try:
+                                self._run_command(
+                                    ["git", "stash", "pop", stash_ref],
+                                    stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.DEVNULL,
+                                    check=True
+                                )
+                                self._show_message(stdscr, [
+                                    "Stash applied successfully!",
+                                    "Press any key to continue..."
+                                ])
+                                # Show modified status without a full reload
+                                self._mark_current_branch(self.current_branch, True)
+                            except subprocess.CalledProcessError as e:
+                                self._show_message(stdscr, [
+                                    "Failed to apply stash!",
+                                    f"Error: {e}",
+                                    "Press any key to continue..."
+                                ])
+                else:
+                    self._show_message(stdscr, [
+                        "Failed to checkout branch!",
+                        "Press any key to continue..."
+                    ])
+            
+            except subprocess.CalledProcessError as e:
+                self._show_message(stdscr, [
+                    f"Error checking git status: {e}",
+                    "Press any key to continue..."
+                ])
     
     def run(self, stdscr) -> None:
         """Main curses UI loop.
@@ -2363,195 +4037,121 @@ class GitBranchManager:
         curses.init_pair(7, curses.COLOR_RED, curses.COLOR_BLACK)  # Old branches (> 1 month)
         curses.init_pair(8, curses.COLOR_WHITE, curses.COLOR_BLACK)  # Normal text
         curses.init_pair(9, curses.COLOR_BLACK, curses.COLOR_CYAN)  # Footer
+        self._color_pairs = [curses.color_pair(i) for i in range(10)]
         
         self.load_branches(stdscr)
         
+        last_frame = None  # (height, width, filtered branch list) of the last full redraw
+        moved_from = None  # Previous selection when only the selection moved
+        screen_intact = False  # Nothing but this loop has drawn since the last frame
+        drawn_rows = {}  # Screen row -> (cached row, selected) currently shown there
+        
         while True:
-            stdscr.clear()
             height, width = stdscr.getmaxyx()
             
-            # Draw header and get content start position
-            start_y = self.draw_header(stdscr, width)
+            self._apply_enrichment_results()
+            if self._remote_refs_future is not None and self._remote_refs_future.done():
+                self._merge_remote_refs()
+            if self._fetch_future is not None and self._fetch_future.done():
+                self._finish_fetch(stdscr)
+                moved_from = None
+                screen_intact = False
             
-            # Display branches
-            footer_height = 2  # Footer takes 2 lines (separator + commands)
-            visible_branches = min(height - start_y - footer_height - 1, len(self.filtered_branches))
+            now_ts = int(time.time())  # Shared by every row formatted in this redraw
+            if now_ts // 60 != self._relative_dates_minute:
+                self._refresh_relative_dates(now_ts)
             
-            # Calculate scroll position
-            if self.selected_index >= visible_branches:
-                scroll_offset = self.selected_index - visible_branches + 1
+            # If only the selection moved within the visible rows, redraw just
+            # the two affected rows instead of the whole screen
+            if (moved_from is not None and last_frame is not None
+                    and last_frame[0] == height and last_frame[1] == width
+                    and last_frame[2] is self.filtered_branches
+                    and scroll_offset <= self.selected_index < scroll_offset + visible_branches
+                    and len(str(moved_from + 1)) == len(str(self.selected_index + 1))):
+                for branch_index in (moved_from, self.selected_index):
+                    self._draw_branch_row(stdscr, start_y + branch_index - scroll_offset, branch_index, width, now_ts, drawn_rows)
+                self._draw_scroll_indicator(stdscr, width, visible_branches)
+                stdscr.noutrefresh()
+                curses.doupdate()
             else:
-                scroll_offset = 0
+                # When nothing else has drawn on the screen since the last frame, keep
+                # the branch rows and redraw only those whose content changed (e.g. as
+                # enrichment results arrive); otherwise start from a blank screen.
+                # erase() rather than clear() so curses only sends the cells that changed
+                header_height = start_y if last_frame is not None else 0
+                partial = (screen_intact and last_frame is not None
+                           and last_frame[0] == height and last_frame[1] == width)
+                if partial:
+                    for y in range(header_height):
+                        stdscr.move(y, 0)
+                        stdscr.clrtoeol()
+                else:
+                    stdscr.erase()
+                    drawn_rows.clear()
                 
-            for i in range(visible_branches):
-                branch_index = i + scroll_offset
-                if branch_index >= len(self.filtered_branches):
-                    break
-                    
-                branch_info = self.filtered_branches[branch_index]
-                y = start_y + i
+                # Draw header and get content start position
+                start_y = self.draw_header(stdscr, width)
+                if partial and start_y != header_height:
+                    # The header changed height and moved every row, so draw from scratch
+                    stdscr.erase()
+                    drawn_rows.clear()
+                    start_y = self.draw_header(stdscr, width)
                 
-                # Prepare display components
-                if branch_info.is_current:
-                    prefix = "* "
-                elif branch_info.is_remote:
-                    prefix = "↓ "  # Down arrow for remote branches
-                else:
-                    prefix = "  "
-                relative_date = branch_info.format_relative_date()
+                # Display branches
+                footer_height = 2  # Footer takes 2 lines (separator + commands)
+                visible_branches = min(height - start_y - footer_height - 1, len(self.filtered_branches))
                 
-                # Determine age-based color for branch
-                days_old = (datetime.now() - branch_info.commit_date).days
-                if days_old < 7:
-                    date_color = 5  # Magenta for recent
-                elif days_old > 30:
-                    date_color = 7  # Red for old
-                else:
-                    date_color = 8  # White for normal
+                # Keep the scroll position while the selection stays in view, scrolling
+                # only as far as needed to reveal it and never past the end of the list
+                if self.selected_index < self._scroll_offset:
+                    self._scroll_offset = self.selected_index
+                elif self.selected_index >= self._scroll_offset + visible_branches:
+                    self._scroll_offset = self.selected_index - visible_branches + 1
+                self._scroll_offset = max(0, min(self._scroll_offset, len(self.filtered_branches) - visible_branches))
+                scroll_offset = self._scroll_offset
                 
-                # Prepare status indicators
-                separator = " • "
-                modified_indicator = " [modified]" if branch_info.has_uncommitted_changes else ""
-                # Add unpushed indicator for local branches
-                unpushed_indicator = ""
-                if not branch_info.is_remote and not branch_info.has_upstream:
-                    unpushed_indicator = " [unpushed]"
-                # Add merged indicator
-                merged_indicator = ""
-                if branch_info.is_merged and not branch_info.is_current and not branch_info.is_remote:
-                    merged_indicator = " [merged]"
-                # Add worktree indicator
-                worktree_indicator = ""
-                if branch_info.in_worktree and not branch_info.is_current:
-                    worktree_indicator = " [worktree]"
-                # Add commit count indicators
-                commit_count_indicator = ""
-                if not branch_info.is_remote:
-                    if branch_info.commits_ahead > 0 and branch_info.commits_behind > 0:
-                        commit_count_indicator = f" [+{branch_info.commits_ahead}/-{branch_info.commits_behind}]"
-                    elif branch_info.commits_ahead > 0:
-                        commit_count_indicator = f" [+{branch_info.commits_ahead}]"
-                    elif branch_info.commits_behind > 0:
-                        commit_count_indicator = f" [-{branch_info.commits_behind}]"
+                self._request_visible_counts(scroll_offset, visible_branches)
+                for i in range(visible_branches):
+                    branch_index = i + scroll_offset
+                    if branch_index >= len(self.filtered_branches):
+                        break
+                    self._draw_branch_row(stdscr, start_y + i, branch_index, width, now_ts, drawn_rows)
                 
-                # Add loading indicator if branch is still being enriched
-                loading_indicator = ""
-                if not branch_info.is_remote and branch_info.name in self.enrichment_in_progress:
-                    loading_indicator = " ↻"
+                # Clear rows left over from a longer list
+                for y in [y for y in drawn_rows if y >= start_y + visible_branches]:
+                    del drawn_rows[y]
+                    stdscr.move(y, 0)
+                    stdscr.clrtoeol()
                 
-                # Calculate available space for commit message
-                fixed_len = len(prefix) + len(branch_info.name) + len(modified_indicator) + len(unpushed_indicator) + len(merged_indicator) + len(worktree_indicator) + len(commit_count_indicator) + len(loading_indicator) + len(separator) * 3 + len(relative_date) + len(branch_info.commit_hash)
-                max_msg_len = width - fixed_len - 1
-                commit_msg = branch_info.commit_message
-                if len(commit_msg) > max_msg_len and max_msg_len > 3:
-                    commit_msg = commit_msg[:max_msg_len-3] + "..."
+                # Add scroll indicator if needed
+                self._draw_scroll_indicator(stdscr, width, visible_branches)
                 
-                # Display with colors
-                x_pos = 0
+                # Draw footer
+                self.draw_footer(stdscr, height, width)
                 
-                if branch_index == self.selected_index:
-                    # Selected row - inverse video
-                    stdscr.attron(curses.color_pair(1))
-                    try:
-                        stdscr.addstr(y, 0, " " * (width - 1))  # Fill background
-                    except curses.error:
-                        pass
-                    x_pos = self.safe_addstr(stdscr, y, x_pos, prefix)
-                    x_pos = self.safe_addstr(stdscr, y, x_pos, branch_info.name)
-                    if modified_indicator:
-                        x_pos = self.safe_addstr(stdscr, y, x_pos, modified_indicator)
-                    if unpushed_indicator:
-                        x_pos = self.safe_addstr(stdscr, y, x_pos, unpushed_indicator)
-                    if merged_indicator:
-                        x_pos = self.safe_addstr(stdscr, y, x_pos, merged_indicator)
-                    if worktree_indicator:
-                        x_pos = self.safe_addstr(stdscr, y, x_pos, worktree_indicator)
-                    if commit_count_indicator:
-                        x_pos = self.safe_addstr(stdscr, y, x_pos, commit_count_indicator)
-                    x_pos = self.safe_addstr(stdscr, y, x_pos, separator)
-                    x_pos = self.safe_addstr(stdscr, y, x_pos, relative_date)
-                    x_pos = self.safe_addstr(stdscr, y, x_pos, separator)
-                    x_pos = self.safe_addstr(stdscr, y, x_pos, branch_info.commit_hash)
-                    x_pos = self.safe_addstr(stdscr, y, x_pos, separator)
-                    x_pos = self.safe_addstr(stdscr, y, x_pos, commit_msg)
-                    stdscr.attroff(curses.color_pair(1))
-                else:
-                    # Non-selected rows with colors
-                    x_pos = self.safe_addstr(stdscr, y, x_pos, prefix)
-                    
-                    # Branch name color
-                    if branch_info.is_current:
-                        x_pos = self.safe_addstr(stdscr, y, x_pos, branch_info.name, curses.color_pair(2))
-                    else:
-                        x_pos = self.safe_addstr(stdscr, y, x_pos, branch_info.name, curses.color_pair(4))
-                    
-                    # Modified indicator
-                    if modified_indicator:
-                        x_pos = self.safe_addstr(stdscr, y, x_pos, modified_indicator, curses.color_pair(3))
-                    
-                    # Unpushed indicator
-                    if unpushed_indicator:
-                        x_pos = self.safe_addstr(stdscr, y, x_pos, unpushed_indicator, curses.color_pair(3))
-                    
-                    # Merged indicator - use green color
-                    if merged_indicator:
-                        x_pos = self.safe_addstr(stdscr, y, x_pos, merged_indicator, curses.color_pair(2))
-                    
-                    # Worktree indicator - use cyan color
-                    if worktree_indicator:
-                        x_pos = self.safe_addstr(stdscr, y, x_pos, worktree_indicator, curses.color_pair(4))
-                    
-                    # Commit count indicator - use different colors for ahead/behind
-                    if commit_count_indicator:
-                        if branch_info.commits_ahead > 0 and branch_info.commits_behind == 0:
-                            # Only ahead - green
-                            x_pos = self.safe_addstr(stdscr, y, x_pos, commit_count_indicator, curses.color_pair(2))
-                        elif branch_info.commits_behind > 0 and branch_info.commits_ahead == 0:
-                            # Only behind - yellow
-                            x_pos = self.safe_addstr(stdscr, y, x_pos, commit_count_indicator, curses.color_pair(3))
-                        else:
-                            # Both ahead and behind - magenta
-                            x_pos = self.safe_addstr(stdscr, y, x_pos, commit_count_indicator, curses.color_pair(5))
-                    
-                    # Loading indicator - use cyan color with animation
-                    if loading_indicator:
-                        x_pos = self.safe_addstr(stdscr, y, x_pos, loading_indicator, curses.color_pair(4))
-                    
-                    x_pos = self.safe_addstr(stdscr, y, x_pos, separator)
-                    
-                    # Date with age-based color
-                    x_pos = self.safe_addstr(stdscr, y, x_pos, relative_date, curses.color_pair(date_color))
-                    
-                    x_pos = self.safe_addstr(stdscr, y, x_pos, separator)
-                    
-                    # Commit hash
-                    x_pos = self.safe_addstr(stdscr, y, x_pos, branch_info.commit_hash, curses.color_pair(6))
-                    
-                    x_pos = self.safe_addstr(stdscr, y, x_pos, separator)
-                    
-                    # Commit message
-                    x_pos = self.safe_addstr(stdscr, y, x_pos, commit_msg)
-            
-            # Add scroll indicator if needed
-            if len(self.filtered_branches) > visible_branches:
-                scroll_pos = self.selected_index / max(1, len(self.filtered_branches) - 1)
-                scroll_pct = int(scroll_pos * 100)
-                scroll_msg = f"[{self.selected_index + 1}/{len(self.filtered_branches)}]"
-                try:
-                    # Show in top right corner
-                    stdscr.addstr(0, width - len(scroll_msg) - 1, scroll_msg, curses.color_pair(9))
-                except curses.error:
-                    pass
+                # Build the whole frame, then flush it to the terminal once
+                stdscr.noutrefresh()
+                curses.doupdate()
+                last_frame = (height, width, self.filtered_branches)
+            moved_from = None
             
-            # Draw footer
-            self.draw_footer(stdscr, height, width)
-            
-            stdscr.refresh()
-            
-            # Handle key press
+            # Handle key press, polling while background work is running so its
+            # results are drawn as they arrive instead of on the next key. When
+            # idle, sleep until the next minute so relative dates stay current
+            background = self.enrichment_in_progress or self._remote_refs_future is not None or self._fetch_future is not None
+            stdscr.timeout(100 if background else (60 - int(time.time()) % 60) * 1000)
             key = stdscr.getch()
+            stdscr.timeout(-1)
+            # Polling timeouts and cursor movement don't draw anything themselves
+            screen_intact = key == -1 or key in _NAVIGATION_KEYS
+            if key == -1:
+                continue
             
-            if key == ord('q') or key == ord('Q'):
+            # Action keys run their handler; quit and navigation keys are handled here
+            handler = self._key_handlers.get(key)
+            if handler is not None:
+                handler(stdscr)
+            elif key == ord('q') or key == ord('Q'):
                 break
             elif key == 27:  # ESC key
                 # If filters are active, clear them instead of quitting
@@ -2559,205 +4159,11 @@ class GitBranchManager:
                     self.clear_all_filters()
                 else:
                     break
-            elif key == ord('?'):  # Show help
-                self.show_help(stdscr)
-            elif key == ord('t') or key == ord('T'):  # Toggle remote branches
-                # Fetch from remote before toggling
-                if not self.show_remotes:  # Only fetch when turning remotes ON
-                    try:
-                        # Use animated spinner for fetch
-                        self._run_command_with_spinner(
-                            stdscr,
-                            ["git", "fetch", "--all"],
-                            "Fetching from remote...",
-                            capture_output=True,
-                            text=True,
-                            check=True
-                        )
-                        
-                        # Invalidate remote-related caches after fetch
-                        if self.cache:
-                            self.cache.invalidate('remote_branches')
-                            self.cache.invalidate('remote_branches_set')
-                            self.cache.invalidate_pattern('merged_branches')
-                            self.cache.invalidate_pattern('branch_info')  # Force re-fetch of branch info
-                        
-                    except subprocess.CalledProcessError as e:
-                        stdscr.clear()
-                        stdscr.addstr(0, 0, f"Fetch failed: {e}")
-                        stdscr.addstr(1, 0, "Press any key to continue...")
-                        stdscr.refresh()
-                        stdscr.getch()
-                        continue
-                
-                self.show_remotes = not self.show_remotes
-                # Reload branches using progressive loading
-                self.load_branches(stdscr)
-                
-                # Adjust selected index if needed
-                if self.selected_index >= len(self.filtered_branches):
-                    self.selected_index = max(0, len(self.filtered_branches) - 1)
-            elif key == ord('f') or key == ord('F'):  # Fetch from remote
-                try:
-                    # Use animated spinner for fetch
-                    result = self._run_command_with_spinner(
-                        stdscr,
-                        ["git", "fetch", "--all"],
-                        "Fetching from remote...",
-                        capture_output=True,
-                        text=True,
-                        check=True
-                    )
-                    
-                    # Invalidate remote-related caches after fetch
-                    if self.cache:
-                        self.cache.invalidate('remote_branches')
-                        self.cache.invalidate('remote_branches_set')
-                        self.cache.invalidate_pattern('merged_branches')
-                    
-                    # Reload branches immediately after fetch
-                    self.load_branches(stdscr)
-                except subprocess.CalledProcessError as e:
-                    stdscr.clear()
-                    stdscr.addstr(0, 0, f"Fetch failed: {e}")
-                    stdscr.addstr(1, 0, "Press any key to continue...")
-                    stdscr.refresh()
-                    stdscr.getch()
-            elif key == ord('r') or key == ord('R'):  # Reload
-                # Clear cache to force fresh data
-                if self.cache:
-                    self.cache.invalidate()  # Clear all cache entries
-                # Reload branches using progressive loading
-                self.load_branches(stdscr)
-                
-                # Adjust selected index if needed
-                if self.selected_index >= len(self.filtered_branches):
-                    self.selected_index = max(0, len(self.filtered_branches) - 1)
-            elif key == ord('/'):  # Search filter
-                search_term = self.show_input_dialog(
-                    stdscr,
-                    "Search branches by name:",
-                    self.search_filter
-                )
-                if search_term is not None:  # User didn't cancel
-                    self.search_filter = search_term
-                    self._apply_filters()
-                    self.selected_index = 0  # Reset to first result
-            elif key == ord('a') or key == ord('A'):  # Author filter
-                self.author_filter = not self.author_filter
-                self._apply_filters()
-                if self.selected_index >= len(self.filtered_branches):
-                    self.selected_index = max(0, len(self.filtered_branches) - 1)
-            elif key == ord('o') or key == ord('O'):  # Old branches filter
-                self.age_filter = not self.age_filter
-                self._apply_filters()
-                if self.selected_index >= len(self.filtered_branches):
-                    self.selected_index = max(0, len(self.filtered_branches) - 1)
-            elif key == ord('m'):  # lowercase m for merged filter (uppercase M is for rename)
-                self.merged_filter = not self.merged_filter
-                self._apply_filters()
-                if self.selected_index >= len(self.filtered_branches):
-                    self.selected_index = max(0, len(self.filtered_branches) - 1)
-            elif key == ord('p') or key == ord('P'):  # Prefix filter
-                prefix = self.show_input_dialog(
-                    stdscr,
-                    "Filter by prefix (e.g. feature/, bugfix/):",
-                    self.prefix_filter
-                )
-                if prefix is not None:  # User didn't cancel
-                    self.prefix_filter = prefix
-                    self._apply_filters()
-                    self.selected_index = 0  # Reset to first result
-            elif key == ord('c') or key == ord('C'):  # Clear filters
-                self.clear_all_filters()
-            elif key == ord('S'):  # Pop stash
-                if self.last_stash_ref:
-                    stdscr.clear()
-                    stdscr.addstr(0, 0, f"Popping stash {self.last_stash_ref}...")
-                    stdscr.refresh()
-                    
-                    try:
-                        self._run_command(
-                            ["git", "stash", "pop", self.last_stash_ref],
-                            capture_output=True,
-                            text=True,
-                            check=True
-                        )
-                        self.last_stash_ref = None  # Clear the reference
-                        # Reload branches to update modified status
-                        self.load_branches(stdscr)
-                    except subprocess.CalledProcessError as e:
-                        stdscr.clear()
-                        stdscr.addstr(0, 0, f"Failed to pop stash: {e}")
-                        stdscr.addstr(1, 0, "Press any key to continue...")
-                        stdscr.refresh()
-                        stdscr.getch()
-                else:
-                    stdscr.clear()
-                    stdscr.addstr(0, 0, "No stash to pop.")
-                    stdscr.addstr(1, 0, "Press any key to continue...")
-                    stdscr.refresh()
-                    stdscr.getch()
-            elif key == ord('N'):  # Create new branch
-                # Get new branch name from user
-                new_branch_name = self.show_input_dialog(
-                    stdscr,
-                    "Enter new branch name:"
-                )
-                
-                if new_branch_name:
-                    # Check if branch already exists
-                    existing_names = [b.name for b in self.branches]
-                    if new_branch_name in existing_names:
-                        stdscr.clear()
-                        stdscr.addstr(0, 0, f"Branch '{new_branch_name}' already exists!")
-                        stdscr.addstr(1, 0, "Press any key to continue...")
-                        stdscr.refresh()
-                        stdscr.getch()
-                        continue
-                    
-                    # Ask if user wants to checkout the new branch
-                    response = self.show_confirmation_dialog(
-                        stdscr,
-                        f"Create branch '{new_branch_name}'?\nAlso checkout the new branch?"
-                    )
-                    
-                    if response == 'yes':
-                        # Create and checkout
-                        try:
-                            self._run_command(
-                                ["git", "checkout", "-b", new_branch_name],
-                                capture_output=True,
-                                text=True,
-                                check=True
-                            )
-                            self.load_branches(stdscr)  # Refresh branch list
-                        except subprocess.CalledProcessError as e:
-                            stdscr.clear()
-                            stdscr.addstr(0, 0, f"Failed to create branch: {e}")
-                            stdscr.addstr(1, 0, "Press any key to continue...")
-                            stdscr.refresh()
-                            stdscr.getch()
-                    elif response == 'no':
-                        # Create without checkout
-                        try:
-                            self._run_command(
-                                ["git", "branch", new_branch_name],
-                                capture_output=True,
-                                text=True,
-                                check=True
-                            )
-                            self.load_branches(stdscr)  # Refresh branch list
-                        except subprocess.CalledProcessError as e:
-                            stdscr.clear()
-                            stdscr.addstr(0, 0, f"Failed to create branch: {e}")
-                            stdscr.addstr(1, 0, "Press any key to continue...")
-                            stdscr.refresh()
-                            stdscr.getch()
-            elif key == curses.KEY_UP:
-                self.selected_index = max(0, self.selected_index - 1)
-            elif key == curses.KEY_DOWN:
-                self.selected_index = min(len(self.filtered_branches) - 1, self.selected_index + 1)
+            elif key == curses.KEY_UP or key == curses.KEY_DOWN:
+                # Apply every arrow press already queued (e.g. a held key) before redrawing once
+                moved_from = self.selected_index
+                delta = self._read_queued_arrow_keys(stdscr, key)
+                self.selected_index = max(0, min(len(self.filtered_branches) - 1, self.selected_index + delta))
             elif key == curses.KEY_PPAGE:  # Page Up
                 # Move up by the number of visible branches
                 page_size = visible_branches
@@ -2771,356 +4177,6 @@ class GitBranchManager:
             elif key == curses.KEY_END:  # End - go to last branch
                 if self.filtered_branches:
                     self.selected_index = len(self.filtered_branches) - 1
-            elif key == ord('D'):  # Shift+D for delete
-                if not self.filtered_branches:
-                    continue
-                selected_branch_info = self.filtered_branches[self.selected_index]
-                selected_branch = selected_branch_info.name
-                
-                # Check if trying to delete a remote branch
-                if selected_branch_info.is_remote:
-                    stdscr.clear()
-                    stdscr.addstr(0, 0, "Cannot delete remote branches!")
-                    stdscr.addstr(1, 0, "Remote branches must be deleted from the remote repository.")
-                    stdscr.addstr(2, 0, "To delete a local copy of a remote branch, switch off remote view (press 't').")
-                    stdscr.addstr(3, 0, "Press any key to continue...")
-                    stdscr.refresh()
-                    stdscr.getch()
-                    continue
-                
-                # Check if trying to delete current branch
-                if selected_branch == self.current_branch:
-                    stdscr.clear()
-                    stdscr.addstr(0, 0, "Cannot delete the current branch!")
-                    stdscr.addstr(1, 0, "Please switch to another branch first.")
-                    stdscr.addstr(2, 0, "Press any key to continue...")
-                    stdscr.refresh()
-                    stdscr.getch()
-                    continue
-                
-                # Check if trying to delete protected branch
-                if selected_branch in self.protected_branches:
-                    response = self.show_confirmation_dialog(
-                        stdscr,
-                        f"WARNING: '{selected_branch}' is a protected branch!\nAre you REALLY sure you want to delete it?"
-                    )
-                    if response != 'yes':
-                        continue
-                
-                # Show confirmation dialog
-                response = self.show_confirmation_dialog(
-                    stdscr,
-                    f"Delete branch '{selected_branch}'?\nThis action cannot be undone."
-                )
-                
-                if response == 'yes':
-                    if self.delete_branch(selected_branch):
-                        self.get_branches(stdscr)  # Refresh branch list
-                        # Adjust selected index if needed
-                        if self.selected_index >= len(self.filtered_branches):
-                            self.selected_index = max(0, len(self.filtered_branches) - 1)
-                    else:
-                        stdscr.clear()
-                        stdscr.addstr(0, 0, f"Failed to delete branch '{selected_branch}'!")
-                        stdscr.addstr(1, 0, "The branch may have unpushed commits or is not fully merged.")
-                        stdscr.addstr(2, 0, "Press any key to continue...")
-                        stdscr.refresh()
-                        stdscr.getch()
-            elif key == ord('M'):  # Shift+M for move/rename
-                if not self.filtered_branches:
-                    continue
-                selected_branch = self.filtered_branches[self.selected_index].name
-                
-                # Get new name from user
-                new_name = self.show_input_dialog(
-                    stdscr,
-                    f"Rename branch '{selected_branch}' to:",
-                    selected_branch
-                )
-                
-                if new_name and new_name != selected_branch:
-                    # Check if new name already exists
-                    existing_names = [b.name for b in self.branches]
-                    if new_name in existing_names:
-                        stdscr.clear()
-                        stdscr.addstr(0, 0, f"Branch '{new_name}' already exists!")
-                        stdscr.addstr(1, 0, "Press any key to continue...")
-                        stdscr.refresh()
-                        stdscr.getch()
-                        continue
-                    
-                    if self.move_branch(selected_branch, new_name):
-                        # Update current branch name if it was renamed
-                        if selected_branch == self.current_branch:
-                            self.current_branch = new_name
-                        self.get_branches(stdscr)  # Refresh branch list
-                    else:
-                        stdscr.addstr(1, 0, f"Failed to rename branch!")
-                        stdscr.addstr(2, 0, "Press any key to continue...")
-                        stdscr.refresh()
-                        stdscr.getch()
-            elif key == ord('B'):  # Shift+B for opening branch in browser (compare/PR)
-                if not self.filtered_branches or not self.url_builder:
-                    if not self.url_builder:
-                        stdscr.clear()
-                        stdscr.addstr(0, 0, "No remote repository URL found!")
-                        stdscr.addstr(1, 0, "Make sure you have a remote named 'origin' configured.")
-                        stdscr.addstr(2, 0, "")
-                        stdscr.addstr(3, 0, "Press 'h' for configuration help, any other key to continue...")
-                        stdscr.refresh()
-                        key = stdscr.getch()
-                        if key == ord('h') or key == ord('H'):
-                            self.show_platform_config_help(stdscr)
-                    continue
-                
-                selected_branch_info = self.filtered_branches[self.selected_index]
-                selected_branch = selected_branch_info.name
-                
-                # Check if branch has been pushed
-                if not selected_branch_info.is_remote and not selected_branch_info.has_upstream:
-                    stdscr.clear()
-                    stdscr.addstr(0, 0, f"Branch '{selected_branch}' has not been pushed to remote!")
-                    stdscr.addstr(1, 0, "Push the branch first before opening in browser.")
-                    stdscr.addstr(2, 0, "")
-                    stdscr.addstr(3, 0, "Press any key to continue...")
-                    stdscr.refresh()
-                    stdscr.getch()
-                    continue
-                
-                # Check if branch is merged and config prevents opening
-                if selected_branch_info.is_merged and self.config.get('prevent_browser_for_merged', False):
-                    stdscr.clear()
-                    stdscr.addstr(0, 0, f"Branch '{selected_branch}' has been merged!")
-                    stdscr.addstr(1, 0, "")
-                    stdscr.addstr(2, 0, "This branch has likely been deleted from the remote repository")
-                    stdscr.addstr(3, 0, "after being merged (based on your configuration).")
-                    stdscr.addstr(4, 0, "")
-                    stdscr.addstr(5, 0, "Press 'o' to open anyway, or any other key to cancel...")
-                    stdscr.addstr(6, 0, "")
-                    stdscr.addstr(7, 0, "To disable this warning, set 'prevent_browser_for_merged' to false")
-                    stdscr.addstr(8, 0, "in your ~/.config/git-branch-manager/config.json file.")
-                    stdscr.refresh()
-                    
-                    key = stdscr.getch()
-                    if key != ord('o') and key != ord('O'):
-                        continue
-                    # If 'o' pressed, fall through to open the browser
-                
-                # For remote branches, strip the remote prefix (e.g., origin/)
-                if selected_branch_info.is_remote and '/' in selected_branch:
-                    branch_name = selected_branch.split('/', 1)[1]
-                else:
-                    branch_name = selected_branch
-                
-                # Build compare URL
-                url = self.url_builder.build_compare_url(branch_name)
-                if url:
-                    try:
-                        # Use the configured browser command
-                        browser_cmd = self.config.get('browser_command', 'open')
-                        self._run_command([browser_cmd, url], check=True)
-                    except subprocess.CalledProcessError:
-                        stdscr.clear()
-                        stdscr.addstr(0, 0, f"Failed to open browser!")
-                        stdscr.addstr(1, 0, f"URL: {url}")
-                        stdscr.addstr(2, 0, "Press any key to continue...")
-                        stdscr.refresh()
-                        stdscr.getch()
-                else:
-                    stdscr.clear()
-                    stdscr.addstr(0, 0, f"Platform '{self.url_builder.platform}' not supported for compare URLs")
-                    stdscr.addstr(1, 0, "")
-                    stdscr.addstr(2, 0, "Press 'h' for configuration help, any other key to continue...")
-                    stdscr.refresh()
-                    key = stdscr.getch()
-                    if key == ord('h') or key == ord('H'):
-                        self.show_platform_config_help(stdscr)
-            elif key == ord('b'):  # lowercase b for opening branch view
-                if not self.filtered_branches or not self.url_builder:
-                    if not self.url_builder:
-                        stdscr.clear()
-                        stdscr.addstr(0, 0, "No remote repository URL found!")
-                        stdscr.addstr(1, 0, "Make sure you have a remote named 'origin' configured.")
-                        stdscr.addstr(2, 0, "")
-                        stdscr.addstr(3, 0, "Press 'h' for configuration help, any other key to continue...")
-                        stdscr.refresh()
-                        key = stdscr.getch()
-                        if key == ord('h') or key == ord('H'):
-                            self.show_platform_config_help(stdscr)
-                    continue
-                
-                selected_branch_info = self.filtered_branches[self.selected_index]
-                selected_branch = selected_branch_info.name
-                
-                # Check if branch has been pushed
-                if not selected_branch_info.is_remote and not selected_branch_info.has_upstream:
-                    stdscr.clear()
-                    stdscr.addstr(0, 0, f"Branch '{selected_branch}' has not been pushed to remote!")
-                    stdscr.addstr(1, 0, "Push the branch first before opening in browser.")
-                    stdscr.addstr(2, 0, "")
-                    stdscr.addstr(3, 0, "Press any key to continue...")
-                    stdscr.refresh()
-                    stdscr.getch()
-                    continue
-                
-                # Check if branch is merged and config prevents opening
-                if selected_branch_info.is_merged and self.config.get('prevent_browser_for_merged', False):
-                    stdscr.clear()
-                    stdscr.addstr(0, 0, f"Branch '{selected_branch}' has been merged!")
-                    stdscr.addstr(1, 0, "")
-                    stdscr.addstr(2, 0, "This branch has likely been deleted from the remote repository")
-                    stdscr.addstr(3, 0, "after being merged (based on your configuration).")
-                    stdscr.addstr(4, 0, "")
-                    stdscr.addstr(5, 0, "Press 'o' to open anyway, or any other key to cancel...")
-                    stdscr.addstr(6, 0, "")
-                    stdscr.addstr(7, 0, "To disable this warning, set 'prevent_browser_for_merged' to false")
-                    stdscr.addstr(8, 0, "in your ~/.config/git-branch-manager/config.json file.")
-                    stdscr.refresh()
-                    
-                    key = stdscr.getch()
-                    if key != ord('o') and key != ord('O'):
-                        continue
-                    # If 'o' pressed, fall through to open the browser
-                
-                # For remote branches, strip the remote prefix (e.g., origin/)
-                if selected_branch_info.is_remote and '/' in selected_branch:
-                    branch_name = selected_branch.split('/', 1)[1]
-                else:
-                    branch_name = selected_branch
-                
-                # Build branch URL
-                url = self.url_builder.build_branch_url(branch_name)
-                if url:
-                    try:
-                        # Use the configured browser command
-                        browser_cmd = self.config.get('browser_command', 'open')
-                        self._run_command([browser_cmd, url], check=True)
-                    except subprocess.CalledProcessError:
-                        stdscr.clear()
-                        stdscr.addstr(0, 0, f"Failed to open browser!")
-                        stdscr.addstr(1, 0, f"URL: {url}")
-                        stdscr.addstr(2, 0, "Press any key to continue...")
-                        stdscr.refresh()
-                        stdscr.getch()
-                else:
-                    stdscr.clear()
-                    stdscr.addstr(0, 0, f"Platform '{self.url_builder.platform}' not supported for branch URLs")
-                    stdscr.addstr(1, 0, "")
-                    stdscr.addstr(2, 0, "Press 'h' for configuration help, any other key to continue...")
-                    stdscr.refresh()
-                    key = stdscr.getch()
-                    if key == ord('h') or key == ord('H'):
-                        self.show_platform_config_help(stdscr)
-            elif key == ord('\n') or key == curses.KEY_ENTER:
-                if not self.filtered_branches:
-                    continue
-                selected_branch_info = self.filtered_branches[self.selected_index]
-                selected_branch = selected_branch_info.name
-                
-                # For remote branches, show the local name that will be created
-                display_name = selected_branch
-                if selected_branch_info.is_remote and '/' in selected_branch:
-                    display_name = selected_branch.split('/', 1)[1]
-                
-                if selected_branch != self.current_branch:
-                    # Check if branch is checked out in a worktree
-                    if selected_branch_info.in_worktree:
-                        stdscr.clear()
-                        stdscr.addstr(0, 0, f"Cannot checkout branch '{selected_branch}'!")
-                        stdscr.addstr(1, 0, "This branch is already checked out in another worktree.")
-                        stdscr.addstr(2, 0, "")
-                        stdscr.addstr(3, 0, "Press any key to continue...")
-                        stdscr.refresh()
-                        stdscr.getch()
-                        continue
-                    
-                    # Check if there are changes to stash
-                    try:
-                        status_result = self._run_command(
-                            ["git", "status", "--porcelain"],
-                            capture_output=True,
-                            text=True,
-                            check=True
-                        )
-                        
-                        has_changes = bool(status_result.stdout.strip())
-                        stashed = False
-                        
-                        if has_changes:
-                            # Show confirmation dialog
-                            response = self.show_confirmation_dialog(
-                                stdscr,
-                                f"You have uncommitted changes.\nStash them before switching to '{display_name}'?"
-                            )
-                            
-                            if response == 'cancel':
-                                continue  # Go back to branch list
-                            elif response == 'yes':
-                                stashed = self.stash_changes()
-                                if not stashed:
-                                    stdscr.clear()
-                                    stdscr.addstr(0, 0, "Failed to stash changes!")
-                                    stdscr.addstr(1, 0, "Press any key to continue...")
-                                    stdscr.refresh()
-                                    stdscr.getch()
-                                    continue
-                            # If 'no', proceed without stashing
-                        
-                        # Checkout branch
-                        if self.checkout_branch(selected_branch, selected_branch_info.is_remote):
-                            self.load_branches(stdscr)  # Refresh branch list
-                            
-                            # Check if the newly checked out branch has any stashes
-                            branch_stashes = self._get_branch_stashes(self.current_branch)
-                            if branch_stashes:
-                                # Show the most recent stash for this branch
-                                most_recent_stash = branch_stashes[0]
-                                stash_ref, stash_message = most_recent_stash
-                                
-                                stdscr.clear()
-                                stdscr.addstr(0, 0, f"Found {len(branch_stashes)} git-branch-manager stash{'es' if len(branch_stashes) > 1 else ''} for branch '{self.current_branch}':")
-                                stdscr.addstr(1, 0, "")
-                                stdscr.addstr(2, 0, f"Most recent: {stash_message}")
-                                stdscr.addstr(3, 0, "")
-                                stdscr.addstr(4, 0, "Apply this stash? (y/n)")
-                                stdscr.refresh()
-                                
-                                key = stdscr.getch()
-                                if key in [ord('y'), ord('Y')]:
-                                    try:
-                                        self._run_command(
-                                            ["git", "stash", "pop", stash_ref],
-                                            capture_output=True,
-                                            text=True,
-                                            check=True
-                                        )
-                                        stdscr.clear()
-                                        stdscr.addstr(0, 0, "Stash applied successfully!")
-                                        stdscr.addstr(1, 0, "Press any key to continue...")
-                                        stdscr.refresh()
-                                        stdscr.getch()
-                                        # Refresh to show modified status
-                                        self.get_branches(stdscr)
-                                    except subprocess.CalledProcessError as e:
-                                        stdscr.clear()
-                                        stdscr.addstr(0, 0, "Failed to apply stash!")
-                                        stdscr.addstr(1, 0, f"Error: {e}")
-                                        stdscr.addstr(2, 0, "Press any key to continue...")
-                                        stdscr.refresh()
-                                        stdscr.getch()
-                        else:
-                            stdscr.clear()
-                            stdscr.addstr(0, 0, "Failed to checkout branch!")
-                            stdscr.addstr(1, 0, "Press any key to continue...")
-                            stdscr.refresh()
-                            stdscr.getch()
-                            
-                    except subprocess.CalledProcessError as e:
-                        stdscr.clear()
-                        stdscr.addstr(0, 0, f"Error checking git status: {e}")
-                        stdscr.addstr(1, 0, "Press any key to continue...")
-                        stdscr.refresh()
-                        stdscr.getch()
 
 def main():
     """Entry point for the Git Branch Manager application.
@@ -3183,19 +4239,22 @@ For more information, visit: https://github.com/daves/git-branch-manager"""
             print(f"Error: Cannot change to directory '{args.directory}': {e}")
             sys.exit(1)
     
-    # Check if we're in a git repository
+    manager = GitBranchManager()
+    
+    # The uncommitted changes check doesn't depend on the branch list, so start
+    # it now and let it run during the repository check and curses setup
+    manager.prefetch_uncommitted_changes()
+    
+    # Loading local branches doubles as the git repository check, and the
+    # result is cached so the first branch load doesn't repeat the command
     try:
-        subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
-            capture_output=True,
-            check=True,
-            cwd=os.getcwd()
-        )
+        local_branches_data = manager._get_local_branch_info()
     except subprocess.CalledProcessError:
         print("Error: Not in a git repository")
         sys.exit(1)
-        
-    manager = GitBranchManager()
+    if manager.cache:
+        manager.cache.set('local_branches', local_branches_data)
+    
     curses.wrapper(manager.run)
 
 if __name__ == "__main__":